@@ -6,6 +6,7 @@ Docusaurus validation and repair framework for opinionated micro-CMS documentati
 
 from __future__ import annotations
 
+import re
 import sys
 from collections import deque
 from pathlib import Path
@@ -20,6 +21,10 @@ from docuchango.schemas import DocsProjectConfig
 
 console = Console()
 
+# Directory segments that identify a document type during migration
+_MIGRATE_DOC_TYPE_DIR = re.compile(r"/(adr|rfcs|memos|prd)/", re.IGNORECASE)
+_MIGRATE_DOC_TYPES = {"adr": "adr", "rfcs": "rfc", "memos": "memo", "prd": "prd"}
+
 
 def _load_docs_project_config(root: Path) -> tuple[DocsProjectConfig | None, Path | None]:
     """Load docs-project.yaml from repo root or docs-cms."""
@@ -631,6 +636,13 @@ def bulk():
     type=click.Path(exists=True, path_type=Path),
     help="Target directory (default: current directory)",
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of worker processes for large document sets",
+)
 @click.option("--dry-run", is_flag=True, help="Preview changes without applying")
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
 def bulk_update(
@@ -640,6 +652,7 @@ def bulk_update(
     rename_field: str | None,
     doc_type: str | None,
     target_path: Path | None,
+    workers: int,
     dry_run: bool,
     verbose: bool,
 ):
@@ -669,6 +682,10 @@ def bulk_update(
         \b
         # Preview changes without applying
         docuchango bulk update --set status=Draft --dry-run
+
+        \b
+        # Spread a large docs tree over 4 processes
+        docuchango bulk update --add project_id=my-project --workers 4
     """
     from docuchango.fixes.bulk_update import bulk_update_files
 
@@ -734,7 +751,7 @@ def bulk_update(
         console.print("[yellow]DRY RUN - No changes will be made[/yellow]")
     console.print(f"Processing {len(all_files)} files...\n")
 
-    results = bulk_update_files(all_files, field_name, value, operation, dry_run)
+    results = bulk_update_files(all_files, field_name, value, operation, dry_run, max_workers=workers)
 
     # Display results
     modified_count = 0
@@ -774,11 +791,18 @@ def bulk_update(
     help="Target directory (default: current directory)",
 )
 @click.option("--dry-run", is_flag=True, help="Preview changes without applying")
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Skip files unchanged since the last run (stored in .docuchango/timestamps.cache.json)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed output")
 def bulk_timestamps(
     doc_type: str | None,
     target_path: Path | None,
     dry_run: bool,
+    use_cache: bool,
     verbose: bool,
 ):
     """Derive created timestamp from git history.
@@ -805,11 +829,15 @@ def bulk_timestamps(
         # Preview changes without applying
         docuchango bulk timestamps --dry-run
 
+        \b
+        # Skip files unchanged since the previous cached run
+        docuchango bulk timestamps --cache
+
         \b
         # Show all files including unchanged
         docuchango bulk timestamps --verbose
     """
-    from docuchango.fixes.timestamps import update_document_timestamps
+    from docuchango.fixes.timestamps import TimestampCache, update_many
 
     # Find files to process
     root = target_path or Path.cwd()
@@ -829,33 +857,36 @@ def bulk_timestamps(
     modified_count = 0
     error_count = 0
 
-    for file_path in all_files:
+    cache = TimestampCache.load(root) if use_cache else None
+
+    for file_path, result in update_many(all_files, dry_run=dry_run, cache=cache):
         try:
-            changed, messages = update_document_timestamps(file_path, dry_run=dry_run)
+            rel_path = file_path.relative_to(root)
+        except ValueError:
+            rel_path = file_path
 
-            try:
-                rel_path = file_path.relative_to(root)
-            except ValueError:
-                rel_path = file_path
+        if isinstance(result, Exception):
+            error_count += 1
+            console.print(f"[red]✗[/red] {rel_path}: {result}")
+            continue
 
-            if changed:
-                modified_count += 1
-                console.print(f"[green]✓[/green] {rel_path}")
-                for msg in messages:
-                    console.print(f"    {msg}")
-            elif verbose:
-                if messages:
-                    console.print(f"[dim]⊘[/dim] {rel_path}: {messages[0]}")
-                else:
-                    console.print(f"[dim]⊘[/dim] {rel_path}: No changes needed")
+        changed, messages = result
+        if changed:
+            modified_count += 1
+            console.print(f"[green]✓[/green] {rel_path}")
+            for msg in messages:
+                console.print(f"    {msg}")
+        elif verbose:
+            if messages:
+                console.print(f"[dim]⊘[/dim] {rel_path}: {messages[0]}")
+            else:
+                console.print(f"[dim]⊘[/dim] {rel_path}: No changes needed")
 
-        except Exception as e:
-            error_count += 1
-            try:
-                rel_path = file_path.relative_to(root)
-            except ValueError:
-                rel_path = file_path
-            console.print(f"[red]✗[/red] {rel_path}: {e}")
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            console.print(f"[yellow]Could not write timestamp cache: {e}[/yellow]")
 
     # Summary
     console.print()
@@ -1057,12 +1088,11 @@ def migrate(
         # Generate author from git config:
         git config user.name
     """
-    import re
     import uuid
 
     import frontmatter
 
-    from docuchango.fixes.timestamps import get_git_dates
+    from docuchango.fixes.timestamps import get_created_date, is_template_file
     from docuchango.fixes.yaml_utils import dumps as frontmatter_dumps
 
     # Find files to process
@@ -1085,7 +1115,7 @@ def migrate(
 
     for file_path in all_files:
         # Skip templates
-        if "template" in file_path.name.lower() or file_path.name.startswith("000-"):
+        if is_template_file(file_path):
             if verbose:
                 try:
                     rel_path = file_path.relative_to(root)
@@ -1110,18 +1140,9 @@ def migrate(
             changes = []
             modified = False
 
-            # Determine document type from path
-            path_str = str(file_path).lower()
-            if "/adr/" in path_str:
-                doc_type_detected = "adr"
-            elif "/rfcs/" in path_str:
-                doc_type_detected = "rfc"
-            elif "/memos/" in path_str:
-                doc_type_detected = "memo"
-            elif "/prd/" in path_str:
-                doc_type_detected = "prd"
-            else:
-                doc_type_detected = None
+            # Determine document type from path in a single scan
+            type_dir = _MIGRATE_DOC_TYPE_DIR.search(str(file_path))
+            doc_type_detected = _MIGRATE_DOC_TYPES[type_dir.group(1).lower()] if type_dir else None
 
             # 1. Add project_id if missing
             if "project_id" not in post.metadata:
@@ -1140,7 +1161,7 @@ def migrate(
 
             # 3. Add created only when missing (preserve immutability)
             if "created" not in post.metadata:
-                created_datetime, _ = get_git_dates(file_path)
+                created_datetime = get_created_date(file_path)
                 if created_datetime:
                     post.metadata["created"] = created_datetime
                     changes.append(f"Added created: {created_datetime} (from git)")
@@ -9,16 +9,45 @@ This module provides flexible operations for updating YAML frontmatter fields:
 
 from __future__ import annotations
 
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
 import frontmatter
 import yaml
 
 from docuchango.fixes.yaml_utils import dumps as frontmatter_dumps
+from docuchango.fixes.yaml_utils import restore_header, split_frontmatter
 
 # Valid bulk update operations
 VALID_OPERATIONS = {"set", "add", "remove", "rename"}
 
+# Frontmatter header between the opening and closing delimiters, split the
+# same way python-frontmatter's YAMLHandler does
+_HEADER_RE = re.compile(r"\A-{3,}\s*$(.*?)^-{3,}\s*$", re.MULTILINE | re.DOTALL)
+
+# Header lines the fast path accepts, all of which YAML loads as written: a
+# top-level ``key: value`` line, a block sequence item, or a blank/comment
+# line. Values are an escape-free quoted string, a flow sequence of plain
+# words, or a plain scalar without ": " or an indicator as its first character.
+_FLOW_ITEM = r"[ \t]*\w[\w./@+-]*(?:[ \t]+[\w./@+-]+)*[ \t]*"
+_SCALAR = (
+    r"""(?:"[^"\\\r\n]*"|'(?:[^'\r\n]|'')*'"""
+    rf"|\[(?:{_FLOW_ITEM}(?:,{_FLOW_ITEM})*)?\]"
+    r"""|[^-?:,\[\]{}#&*!|>'"%@`\s](?:[^:#\r\n]|:(?=\S)|(?<=\S)#)*)"""
+)
+_HEADER_LINE_RE = re.compile(
+    rf"(?:(?P<key>[A-Za-z_][\w.-]*)[ \t]*:(?!\S)(?:[ \t]+(?P<value>{_SCALAR}))?"
+    rf"|(?P<item> *)-[ \t]+{_SCALAR})?[ \t]*(?:#.*)?\r?"
+)
+# Characters the YAML reader rejects anywhere in the stream
+_NON_PRINTABLE_RE = re.compile("[^\x09\x0a\x0d\x20-\x7e\x85\xa0-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+# Files to skip: templates (any case), 000- placeholders, and index.md
+_SKIP_NAME_RE = re.compile(r"(?i:template)|\A000-|\Aindex\.md\Z")
+
 
 def should_skip_file(file_path: Path) -> bool:
     """Check if file should be skipped.
@@ -29,12 +58,13 @@ def should_skip_file(file_path: Path) -> bool:
     Returns:
         True if file should be skipped
     """
-    # Skip templates
-    if "template" in file_path.name.lower() or file_path.name.startswith("000-"):
-        return True
+    return _should_skip_name(file_path.name)
+
 
-    # Skip index files
-    return file_path.name == "index.md"
+@lru_cache(maxsize=4096)
+def _should_skip_name(name: str) -> bool:
+    """Check a file name against the skip rules (see should_skip_file)."""
+    return _SKIP_NAME_RE.search(name) is not None
 
 
 def serialize_frontmatter(metadata: dict[str, object]) -> str:
@@ -56,6 +86,53 @@ def serialize_frontmatter(metadata: dict[str, object]) -> str:
     return yaml_str.strip()
 
 
+@lru_cache(maxsize=256)
+def _is_plain_scalar(text: str) -> bool:
+    """Check if text is written unquoted in YAML and loads back as the same string."""
+    try:
+        return bool(text) and text.strip() == text and yaml.safe_load(text) == text
+    except yaml.YAMLError:
+        return False
+
+
+def _already_applied(content: str, field_name: str, new_value: str | None, operation: str) -> bool:
+    """Check whether a set/add would be a no-op without parsing the frontmatter.
+
+    Only handles a single top-level ``field: value`` line where both sides are
+    plain YAML scalars, in a header made only of lines _HEADER_LINE_RE accepts;
+    anything else, including a header that would not parse, is left to the
+    full parse.
+    """
+    if operation not in ("set", "add") or not _is_plain_scalar(field_name):
+        return False
+    header = _HEADER_RE.match(content)
+    if header is None or _NON_PRINTABLE_RE.search(header.group(1)):
+        return False
+
+    values = []
+    sequence_allowed = False
+    sequence_indent: int | None = None
+    for line in header.group(1).split("\n"):
+        parsed = _HEADER_LINE_RE.fullmatch(line)
+        if parsed is None:
+            return False
+        if parsed["key"] is not None:
+            # Only a key without an inline value can open a block sequence
+            sequence_allowed, sequence_indent = parsed["value"] is None, None
+            if parsed["key"] == field_name:
+                values.append((parsed["value"] or "").strip())
+        elif parsed["item"] is not None:
+            if not sequence_allowed or sequence_indent not in (None, len(parsed["item"])):
+                return False
+            sequence_indent = len(parsed["item"])
+
+    if len(values) != 1:
+        return False
+    if operation == "add":
+        return True
+    return new_value is not None and _is_plain_scalar(new_value) and values[0] == new_value
+
+
 def update_frontmatter_bulk(
     content: str, field_name: str, new_value: str | None, operation: str
 ) -> tuple[str, bool, str]:
@@ -80,6 +157,11 @@ def update_frontmatter_bulk(
     if operation == "rename" and not rename_target:
         raise ValueError("Rename operation requires a non-empty new field name")
 
+    if _already_applied(content, field_name, new_value, operation):
+        if operation == "set":
+            return content, False, f"Field {field_name} already has value '{new_value}'"
+        return content, False, f"Field {field_name} already exists"
+
     try:
         post = frontmatter.loads(content)
     except Exception as e:
@@ -150,12 +232,54 @@ def update_frontmatter_bulk(
         return content, False, f"Error serializing frontmatter: {e}"
 
 
+def _update_file(
+    file_path: Path, field_name: str, value: str | None, operation: str, dry_run: bool
+) -> tuple[Path, bool, str] | None:
+    """Apply a bulk update to a single file.
+
+    Returns:
+        (file_path, changed, message) tuple, or None if there is nothing to report
+    """
+    # Only the frontmatter header is decoded and rewritten; the body bytes are
+    # passed through untouched. Without a delimited header (e.g. a file with
+    # no frontmatter yet) fall back to the whole document.
+    try:
+        raw = file_path.read_bytes()
+        raw_header, body = split_frontmatter(raw)
+        header = raw_header.decode("utf-8")
+        content = header + "---\n" if raw_header else raw.decode("utf-8")
+    except Exception as e:
+        return file_path, False, f"Error reading file: {e}"
+
+    new_content, modified, message = update_frontmatter_bulk(content, field_name, value, operation)
+
+    if modified and not dry_run:
+        if raw_header:
+            new_content = restore_header(new_content, header)
+        try:
+            file_path.write_bytes(new_content.encode("utf-8") + (body if raw_header else b""))
+        except Exception as e:
+            return file_path, False, f"Error writing file: {e}"
+
+    if modified or message:
+        return file_path, modified, message
+    return None
+
+
+def _update_file_occurrences(
+    file_path: Path, count: int, field_name: str, value: str | None, operation: str, dry_run: bool
+) -> list[tuple[Path, bool, str] | None]:
+    """Apply a bulk update to a file once per occurrence in the input list."""
+    return [_update_file(file_path, field_name, value, operation, dry_run) for _ in range(count)]
+
+
 def bulk_update_files(
     file_paths: list[Path],
     field_name: str,
     value: str | None,
     operation: str,
     dry_run: bool = False,
+    max_workers: int = 1,
 ) -> list[tuple[Path, bool, str]]:
     """Bulk update frontmatter fields across multiple files.
 
@@ -168,34 +292,30 @@ def bulk_update_files(
         value: New value for the field (or new name for rename)
         operation: Operation type (set, add, remove, rename)
         dry_run: Preview changes without modifying files
+        max_workers: Number of worker processes; 1 processes files in this process
 
     Returns:
         List of (file_path, changed, message) tuples - one per input file path
     """
-    results = []
-
-    # Process each file path in the list, including duplicates
-    for file_path in file_paths:
-        # Skip certain files
-        if should_skip_file(file_path):
-            continue
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except Exception as e:
-            results.append((file_path, False, f"Error reading file: {e}"))
-            continue
-
-        new_content, modified, message = update_frontmatter_bulk(content, field_name, value, operation)
-
-        if modified and not dry_run:
-            try:
-                file_path.write_text(new_content, encoding="utf-8")
-            except Exception as e:
-                results.append((file_path, False, f"Error writing file: {e}"))
-                continue
-
-        if modified or message:
-            results.append((file_path, modified, message))
-
-    return results
+    # Skip certain files
+    paths = [file_path for file_path in file_paths if not should_skip_file(file_path)]
+
+    if max_workers > 1 and len(paths) > 1:
+        # Every occurrence of a path goes to the same worker, in list order, so
+        # duplicates behave as they do serially (first modifies, rest don't)
+        occurrences = Counter(paths)
+        update = partial(
+            _update_file_occurrences, field_name=field_name, value=value, operation=operation, dry_run=dry_run
+        )
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            per_path = {
+                file_path: iter(path_results)
+                for file_path, path_results in zip(
+                    occurrences, executor.map(update, occurrences, occurrences.values(), chunksize=16), strict=True
+                )
+            }
+        outcomes = [next(per_path[file_path]) for file_path in paths]
+    else:
+        outcomes = [_update_file(file_path, field_name, value, operation, dry_run) for file_path in paths]
+
+    return [outcome for outcome in outcomes if outcome is not None]
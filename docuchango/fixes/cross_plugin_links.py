@@ -10,6 +10,22 @@ Usage:
 
 import re
 from pathlib import Path
+from typing import cast
+
+# Patterns, matched in a single pass (group name is the target route):
+#   [text](../rfcs/RFC-XXX-name.md)   -> [text](/rfc/RFC-XXX-name)
+#   [text](../adr/ADR-XXX-name.md)    -> [text](/adr/ADR-XXX-name)
+#   [text](../memos/MEMO-XXX-name.md) -> [text](/memos/MEMO-XXX-name)
+_CROSS_PLUGIN_LINK = re.compile(
+    r"\]\(\.\./(?:rfcs/(?P<rfc>RFC-[^)]+)|adr/(?P<adr>ADR-[^)]+)|memos/(?P<memos>MEMO-[^)]+))\.md\)"
+)
+
+
+def _absolute_link(match: re.Match[str]) -> str:
+    """Rewrite a matched relative link to its absolute Docusaurus path."""
+    # Exactly one named group takes part in a match, so lastgroup is always set
+    route = cast(str, match.lastgroup)
+    return f"](/{route}/{match[route]})"
 
 
 def fix_cross_plugin_links(file_path: Path, dry_run: bool = False) -> int:
@@ -17,14 +33,7 @@ def fix_cross_plugin_links(file_path: Path, dry_run: bool = False) -> int:
     content = file_path.read_text(encoding="utf-8")
     original_content = content
 
-    # Pattern: [text](../rfcs/RFC-XXX-name.md) -> [text](/rfc/RFC-XXX-name)
-    content = re.sub(r"\]\(\.\./rfcs/(RFC-[^)]+)\.md\)", r"](/rfc/\1)", content)
-
-    # Pattern: [text](../adr/ADR-XXX-name.md) -> [text](/adr/ADR-XXX-name)
-    content = re.sub(r"\]\(\.\./adr/(ADR-[^)]+)\.md\)", r"](/adr/\1)", content)
-
-    # Pattern: [text](../memos/MEMO-XXX-name.md) -> [text](/memos/MEMO-XXX-name)
-    content = re.sub(r"\]\(\.\./memos/(MEMO-[^)]+)\.md\)", r"](/memos/\1)", content)
+    content = _CROSS_PLUGIN_LINK.sub(_absolute_link, content)
 
     if content != original_content:
         if not dry_run:
@@ -9,71 +9,154 @@ Note: The 'updated' field is not stored in frontmatter as it can be derived from
 
 from __future__ import annotations
 
+import json
 import re
 import subprocess
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 import frontmatter
 
+from docuchango import __version__
+from docuchango.fixes.yaml_utils import split_frontmatter
 
-def get_git_dates(file_path: Path) -> tuple[str | None, str | None]:
-    """Get creation and last update datetimes from git history.
+# Anchors used to place a new 'created' field, in order of preference
+_STATUS_INSERT = re.compile(r"(status:.*\n)")
+_ID_INSERT = re.compile(r"(id:.*\n)")
+_FRONTMATTER_OPEN = re.compile(r"(^---\n)", re.MULTILINE)
+_CREATED_LINE = re.compile(r"^created:.*$", re.MULTILINE)
 
-    Args:
-        file_path: Path to the file
+# Raw (undecoded) header checks for the no-change fast path
+_RAW_CREATED_LINE = re.compile(rb"^created:", re.MULTILINE)
+_RAW_DATE_LINE = re.compile(rb"^date:", re.MULTILINE)
+
+
+@lru_cache(maxsize=32)
+def _field_pattern(field_name: str) -> re.Pattern[str]:
+    """Compile the pattern matching a single-line field value with optional trailing comment."""
+    return re.compile(rf"^({field_name}:\s*)([^\s#]+)(.*?)$", re.MULTILINE)
 
-    Returns:
-        Tuple of (created_datetime, updated_datetime) in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ)
-        Returns (None, None) if file is not in git history
-    """
-    try:
-        # Get absolute path and work from file's directory
-        abs_path = file_path.resolve()
-        cwd = abs_path.parent
 
-        # Get first commit date (creation)
+@lru_cache(maxsize=32)
+def _field_line_pattern(field_name: str) -> re.Pattern[str]:
+    """Compile the pattern matching a whole single-line field including its newline."""
+    return re.compile(rf"^{field_name}:.*\n", re.MULTILINE)
+
+
+def is_template_file(file_path: Path) -> bool:
+    """Check whether a file is a document template that carries no real timestamps."""
+    return "template" in file_path.name.lower() or file_path.name.startswith("000-")
+
+
+def _normalize_git_datetime(value: str) -> str:
+    """Convert a git %aI timestamp to ISO 8601 UTC (YYYY-MM-DDTHH:MM:SSZ)."""
+    # Commits authored in UTC are already in the target form; only other
+    # offsets need a real timezone conversion.
+    if (len(value) == 25 and value.endswith("+00:00")) or (len(value) == 20 and value.endswith("Z")):
+        return value[:19] + "Z"
+
+    # Normalize UTC suffixes before converting to UTC.
+    value = value.replace("Z", "+00:00")
+    return datetime.fromisoformat(value).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@lru_cache(maxsize=256)
+def _git_toplevel(directory: Path) -> Path | None:
+    """Find the root of the git work tree containing a directory (cached per directory)."""
+    try:
         result = subprocess.run(
-            ["git", "log", "--follow", "--format=%aI", "--reverse", "--", abs_path.name],
-            cwd=cwd,
+            ["git", "-C", str(directory), "rev-parse", "--show-toplevel"],
             capture_output=True,
             text=True,
             check=True,
         )
-        commits = result.stdout.strip().split("\n")
-        if not commits or not commits[0]:
-            return None, None
-
-        first_commit = commits[0]
-        # Normalize UTC suffixes before converting to UTC.
-        first_commit = first_commit.replace("Z", "+00:00")
-        # Convert to UTC and format as ISO 8601 datetime
-        created_dt = datetime.fromisoformat(first_commit).astimezone(timezone.utc)
-        created_datetime = created_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Get last commit date (update)
+    except subprocess.CalledProcessError:
+        return None
+    return Path(result.stdout.strip())
+
+
+def _git_log_dates(file_path: Path, *options: str) -> list[str]:
+    """List a file's commit author dates (%aI), following renames.
+
+    Runs git against the cached repository root with a root-relative path,
+    so git doesn't rediscover the repository for every file. Extra git log
+    options (ordering, limits, filters) are passed through.
+    """
+    abs_path = file_path.resolve()
+    repo_root = _git_toplevel(abs_path.parent)
+    if repo_root is None:
+        return []
+
+    try:
+        rel_path = abs_path.relative_to(repo_root)
+    except ValueError:
+        return []
+
+    try:
         result = subprocess.run(
-            ["git", "log", "--follow", "-1", "--format=%aI", "--", abs_path.name],
-            cwd=cwd,
+            ["git", "-C", str(repo_root), "log", "--follow", *options, "--format=%aI", "--", rel_path.as_posix()],
             capture_output=True,
             text=True,
             check=True,
         )
-        last_commit = result.stdout.strip()
-        if not last_commit:
-            return created_datetime, created_datetime
+    except subprocess.CalledProcessError:
+        return []
+    return result.stdout.split()
 
-        # Normalize UTC suffixes before converting to UTC.
-        last_commit = last_commit.replace("Z", "+00:00")
-        # Convert to UTC and format as ISO 8601 datetime
-        updated_dt = datetime.fromisoformat(last_commit).astimezone(timezone.utc)
-        updated_datetime = updated_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        return created_datetime, updated_datetime
+def get_created_date(file_path: Path) -> str | None:
+    """Get the creation datetime from git history.
 
-    except subprocess.CalledProcessError:
+    Only runs the single git query needed for 'created', which is the only
+    timestamp stored in frontmatter.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        First commit datetime in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ),
+        or None if file is not in git history
+    """
+    # Listing only the commits that added the file keeps the log short. A
+    # file that was deleted and re-added has several; the oldest is the
+    # creation date, matching get_git_dates. --follow only tracks renames
+    # while git walks history newest first (with --reverse it misses commits
+    # across a rename), so the oldest entry is the last one.
+    commits = _git_log_dates(file_path, "--diff-filter=A")
+    if not commits:
+        # No addition commit was found (e.g. unusual rename history), so
+        # fall back to the oldest commit touching the file.
+        commits = _git_log_dates(file_path)
+    if not commits:
+        return None
+    return _normalize_git_datetime(commits[-1])
+
+
+def get_git_dates(file_path: Path) -> tuple[str | None, str | None]:
+    """Get creation and last update datetimes from git history.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (created_datetime, updated_datetime) in ISO 8601 format (YYYY-MM-DDTHH:MM:SSZ)
+        Returns (None, None) if file is not in git history
+    """
+    # One log yields both the last and first commit. It stays newest first
+    # because --follow only tracks renames in that order; with --reverse it
+    # misses commits across a rename.
+    commits = _git_log_dates(file_path)
+    if not commits:
         return None, None
 
+    created_datetime = _normalize_git_datetime(commits[-1])
+    if len(commits) == 1:
+        return created_datetime, created_datetime
+    return created_datetime, _normalize_git_datetime(commits[0])
+
 
 def update_frontmatter_field(content: str, field_name: str, new_value: str) -> str:
     """Update a specific field in YAML frontmatter.
@@ -89,36 +172,35 @@ def update_frontmatter_field(content: str, field_name: str, new_value: str) -> s
     Returns:
         Updated content
     """
-    pattern = rf"^({field_name}:\s*)([^\s#]+)(.*?)$"
-
-    def replacer(match):
-        prefix = match.group(1)  # "field: "
-        suffix = match.group(3)  # comments and whitespace
-        return f"{prefix}{new_value}{suffix}"
-
-    # Update the field
-    return re.sub(pattern, replacer, content, flags=re.MULTILINE)
+    # Keep "field: " (group 1) and trailing comments/whitespace (group 3). Only
+    # backslashes are special in a replacement template, and frontmatter
+    # fields are unique, so stop after the first match.
+    escaped_value = new_value.replace("\\", "\\\\")
+    return _field_pattern(field_name).sub(rf"\g<1>{escaped_value}\g<3>", content, count=1)
 
 
 def remove_frontmatter_field(content: str, field_name: str) -> str:
     """Remove a simple single-line field from YAML frontmatter."""
-    pattern = rf"^{field_name}:.*\n"
-    return re.sub(pattern, "", content, flags=re.MULTILINE)
+    return _field_line_pattern(field_name).sub("", content)
 
 
 def insert_created_field(content: str, created_date: str) -> str:
     """Insert a created field into frontmatter near other identity metadata."""
     created_line = f"created: {created_date}\n"
 
-    for pattern in (r"(status:.*\n)", r"(id:.*\n)", r"(^---\n)"):
-        if re.search(pattern, content, flags=re.MULTILINE):
-            return re.sub(pattern, rf"\1{created_line}", content, count=1, flags=re.MULTILINE)
+    for pattern in (_STATUS_INSERT, _ID_INSERT, _FRONTMATTER_OPEN):
+        new_content, count = pattern.subn(rf"\1{created_line}", content, count=1)
+        if count:
+            return new_content
 
     return content
 
 
 def frontmatter_value_to_string(value: object) -> str:
     """Convert a parsed frontmatter value back to a YAML-friendly timestamp string."""
+    if isinstance(value, str):
+        return value
+
     if isinstance(value, datetime):
         if value.tzinfo is not None:
             value = value.astimezone(timezone.utc)
@@ -142,79 +224,224 @@ def migrate_date_to_created(content: str, created_date: str) -> str:
         Updated content with 'date' removed and 'created' added if needed
     """
     new_content = remove_frontmatter_field(content, "date")
-    if re.search(r"^created:.*$", new_content, flags=re.MULTILINE):
+    if _CREATED_LINE.search(new_content):
         return new_content
 
     return insert_created_field(new_content, created_date)
 
 
-def update_document_timestamps(file_path: Path, dry_run: bool = False) -> tuple[bool, list[str]]:
+class TimestampCache:
+    """Remember documents that needed no timestamp changes across runs.
+
+    Entries are keyed by path relative to the cache root and store the
+    file's mtime (ns) and the repository HEAD at the time of the check. A
+    document is skipped only while both are unchanged, since a new commit
+    can change its git history and an edit can change its frontmatter.
+    The whole cache is discarded when the docuchango version changes.
+    """
+
+    def __init__(self, root: Path, head: str | None, entries: dict[str, dict[str, object]] | None = None):
+        self.root = root
+        self.head = head
+        self.entries = entries if entries is not None else {}
+
+    @staticmethod
+    def cache_path(root: Path) -> Path:
+        """Location of the cache file for a documentation root."""
+        return root / ".docuchango" / "timestamps.cache.json"
+
+    @classmethod
+    def load(cls, root: Path) -> TimestampCache:
+        """Load the cache for a root, starting empty if missing, stale, or unreadable."""
+        root = root.resolve()
+        repo_root = _git_toplevel(root)
+        head = None
+        if repo_root is not None:
+            try:
+                result = subprocess.run(
+                    ["git", "-C", str(repo_root), "rev-parse", "HEAD"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                head = result.stdout.strip()
+            except subprocess.CalledProcessError:
+                head = None
+
+        try:
+            data = json.loads(cls.cache_path(root).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(root, head)
+
+        if not isinstance(data, dict) or data.get("version") != __version__:
+            return cls(root, head)
+        entries = data.get("files")
+        return cls(root, head, entries if isinstance(entries, dict) else None)
+
+    def _entry_key(self, file_path: Path) -> tuple[str, int] | None:
+        try:
+            abs_path = file_path.resolve()
+            return abs_path.relative_to(self.root).as_posix(), abs_path.stat().st_mtime_ns
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, file_path: Path) -> bool:
+        """Check whether a file is unchanged since it was last recorded."""
+        key = self._entry_key(file_path)
+        if key is None:
+            return False
+        entry = self.entries.get(key[0])
+        return entry is not None and entry.get("mtime") == key[1] and entry.get("head") == self.head
+
+    def record(self, file_path: Path) -> None:
+        """Record a file as needing no changes at its current mtime and HEAD."""
+        key = self._entry_key(file_path)
+        if key is not None:
+            self.entries[key[0]] = {"mtime": key[1], "head": self.head}
+
+    def save(self) -> None:
+        """Write the cache file, creating its directory if needed.
+
+        A new cache directory gets its own .gitignore so the cache never
+        shows up as untracked content in the documentation repository.
+        """
+        path = self.cache_path(self.root)
+        if not path.parent.is_dir():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            (path.parent / ".gitignore").write_text("# Created by docuchango\n*\n", encoding="utf-8")
+        data = {"version": __version__, "files": self.entries}
+        path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def update_document_timestamps(
+    file_path: Path, dry_run: bool = False, cache: TimestampCache | None = None
+) -> tuple[bool, list[str]]:
     """Update timestamps in a document based on git history.
 
     Args:
         file_path: Path to the markdown file
         dry_run: If True, don't write changes
+        cache: Optional cache of documents known to need no changes
 
     Returns:
         Tuple of (changed, messages)
     """
-    messages = []
-
     # Skip templates
-    if "template" in file_path.name.lower() or file_path.name.startswith("000-"):
+    if is_template_file(file_path):
         return False, []
 
-    # Read file content
+    if cache is not None and cache.is_fresh(file_path):
+        return False, []
+
+    changed, messages = _update_document_timestamps(file_path, dry_run)
+    # Remember the document unless a change is still pending (dry run) or
+    # it failed; a rewritten file is recorded at its new mtime.
+    if cache is not None and not (changed and dry_run) and not any(msg.startswith("Error") for msg in messages):
+        cache.record(file_path)
+    return changed, messages
+
+
+def _update_document_timestamps(file_path: Path, dry_run: bool) -> tuple[bool, list[str]]:
+    """Apply timestamp updates to a single non-template document."""
+    messages = []
+
+    # Read raw bytes: only the frontmatter header ever needs decoding
     try:
-        content = file_path.read_text(encoding="utf-8")
+        raw = file_path.read_bytes()
     except Exception as e:
         return False, [f"Error reading file: {e}"]
 
+    # Existing 'created' values are immutable, so a header that already has
+    # one and no legacy 'date' needs neither YAML parsing nor git.
+    raw_header, body = split_frontmatter(raw)
+    if raw_header and _RAW_CREATED_LINE.search(raw_header) and not _RAW_DATE_LINE.search(raw_header):
+        return False, []
+
+    # Edit only the frontmatter header so regex work doesn't scale with the
+    # body; without a delimited header fall back to the whole document.
+    if not raw_header:
+        raw_header, body = raw, b""
+    try:
+        header = raw_header.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return False, [f"Error reading file: {e}"]
+
     # Parse frontmatter
     try:
-        post = frontmatter.loads(content)
+        post = frontmatter.loads(header + "---\n" if body else header)
     except Exception as e:
         return False, [f"Error parsing frontmatter: {e}"]
 
     if not post.metadata:
         return False, ["No frontmatter found"]
 
-    modified = False
-    new_content = content
     has_legacy_date = "date" in post.metadata
     has_created = "created" in post.metadata
 
     if has_legacy_date and has_created:
-        new_content = remove_frontmatter_field(new_content, "date")
-        if new_content != content:
-            modified = True
-            messages.append("Removed deprecated 'date' field")
+        new_header = remove_frontmatter_field(header, "date")
+        message = "Removed deprecated 'date' field"
     elif has_legacy_date:
-        created_date, _ = get_git_dates(file_path)
+        created_date = get_created_date(file_path)
         if not created_date:
             created_date = frontmatter_value_to_string(post.metadata["date"])
 
-        new_content = migrate_date_to_created(new_content, created_date)
-        if new_content != content:
-            modified = True
-            messages.append("Migrated 'date' → 'created'")
+        # The parsed metadata already tells us 'created' is absent, so skip
+        # migrate_date_to_created's re-scan and edit the text directly.
+        new_header = insert_created_field(remove_frontmatter_field(header, "date"), created_date)
+        message = "Migrated 'date' → 'created'"
     elif has_created:
         return False, []
     else:
-        created_date, _ = get_git_dates(file_path)
+        created_date = get_created_date(file_path)
         if not created_date:
             return False, ["No git history found"]
 
-        new_content = insert_created_field(new_content, created_date)
-        if new_content != content:
-            modified = True
-            messages.append(f"Added 'created': {created_date}")
+        new_header = insert_created_field(header, created_date)
+        message = f"Added 'created': {created_date}"
+
+    # Only report and write when the text actually changed
+    modified = new_header != header
+    if modified:
+        messages.append(message)
 
     # Write updated content
     if modified and not dry_run:
         try:
-            file_path.write_text(new_content, encoding="utf-8")
+            file_path.write_bytes(new_header.encode("utf-8") + body)
         except Exception as e:
             return False, [f"Error writing file: {e}"]
 
     return modified, messages
+
+
+def update_many(
+    file_paths: Iterable[Path],
+    dry_run: bool = False,
+    max_workers: int = 8,
+    cache: TimestampCache | None = None,
+) -> Iterator[tuple[Path, tuple[bool, list[str]] | Exception]]:
+    """Update timestamps for many documents concurrently.
+
+    Each document is independent and the work is dominated by waiting on
+    git subprocesses and file I/O, so a thread pool overlaps that latency.
+
+    Args:
+        file_paths: Markdown files to process
+        dry_run: If True, don't write changes
+        max_workers: Maximum number of worker threads
+        cache: Optional cache of documents known to need no changes
+
+    Yields:
+        (file_path, result) pairs in input order, where result is the
+        (changed, messages) tuple or the exception raised for that file
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(path, executor.submit(update_document_timestamps, path, dry_run, cache)) for path in file_paths]
+        for path, future in futures:
+            result: tuple[bool, list[str]] | Exception
+            try:
+                result = future.result()
+            except Exception as e:
+                result = e
+            yield path, result
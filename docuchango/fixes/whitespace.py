@@ -8,121 +8,111 @@ This module provides fixes for:
 
 from __future__ import annotations
 
+import re
+import uuid
 from pathlib import Path
 
 import frontmatter
 
 from docuchango.fixes.yaml_utils import dumps as frontmatter_dumps
+from docuchango.fixes.yaml_utils import restore_header, split_frontmatter
+
+# python-frontmatter strips the text before looking for the opening delimiter,
+# so leading whitespace is allowed here too
+_FRONTMATTER_START = re.compile(r"\s*---")
 
 
 def trim_string_values(metadata: dict) -> tuple[dict, list[str]]:
     """Trim whitespace from all string values in metadata.
 
+    The dictionary is updated in place; only values that change are reassigned.
+
     Args:
         metadata: Frontmatter metadata dictionary
 
     Returns:
-        Tuple of (updated_metadata, messages)
+        Tuple of (metadata, messages)
     """
     messages = []
-    updated = {}
 
     for key, value in metadata.items():
         if isinstance(value, str):
+            # strip() returns the string itself when there is nothing to trim
             trimmed = value.strip()
             if trimmed != value:
                 messages.append(f"Trimmed whitespace from '{key}' field")
-                updated[key] = trimmed
-            else:
-                updated[key] = value
+                metadata[key] = trimmed
         elif isinstance(value, list):
-            # Trim strings in arrays
-            new_list = []
-            list_changed = False
-            for item in value:
-                if isinstance(item, str):
-                    trimmed = item.strip()
-                    if trimmed != item:
-                        list_changed = True
-                    new_list.append(trimmed)
-                else:
-                    new_list.append(item)
-            if list_changed:
+            # Trim strings in arrays, building a new list only when one needs it
+            if any(item.strip() != item for item in value if isinstance(item, str)):
                 messages.append(f"Trimmed whitespace from items in '{key}' array")
-            updated[key] = new_list
-        else:
-            updated[key] = value
+                metadata[key] = [item.strip() if isinstance(item, str) else item for item in value]
 
-    return updated, messages
+    return metadata, messages
 
 
 def normalize_empty_values(metadata: dict) -> tuple[dict, list[str]]:
     """Normalize empty values (remove empty strings, keep empty arrays).
 
+    The dictionary is updated in place; only removed keys are touched.
+
     Args:
         metadata: Frontmatter metadata dictionary
 
     Returns:
-        Tuple of (updated_metadata, messages)
+        Tuple of (metadata, messages)
     """
     messages = []
-    updated = {}
 
     # Fields that should be empty arrays, not missing
     array_fields = {"tags", "authors", "reviewers", "related"}
 
-    for key, value in metadata.items():
-        # Convert empty strings to missing (don't add to updated)
+    for key, value in list(metadata.items()):
+        # Convert empty strings to missing
         if isinstance(value, str) and value.strip() == "":
             messages.append(f"Removed empty string value from '{key}'")
-            continue
+            del metadata[key]
 
         # Convert None to missing for optional fields
-        if value is None:
+        elif value is None:
             messages.append(f"Removed null value from '{key}'")
-            continue
+            del metadata[key]
 
         # Keep empty arrays for list fields
-        if isinstance(value, list) and len(value) == 0:
-            if key in array_fields:
-                updated[key] = value
-            else:
-                messages.append(f"Removed empty array from '{key}'")
-            continue
-
-        updated[key] = value
+        elif isinstance(value, list) and len(value) == 0 and key not in array_fields:
+            messages.append(f"Removed empty array from '{key}'")
+            del metadata[key]
 
-    return updated, messages
+    return metadata, messages
 
 
 def ensure_required_fields(metadata: dict) -> tuple[dict, list[str]]:
     """Ensure required fields are present with defaults.
 
+    The dictionary is updated in place; only missing fields are added.
+
     Args:
         metadata: Frontmatter metadata dictionary
 
     Returns:
-        Tuple of (updated_metadata, messages)
+        Tuple of (metadata, messages)
     """
-    import uuid
-
     messages = []
-    updated = metadata.copy()
 
     # Common required fields
-    if "tags" not in updated:
-        updated["tags"] = []
+    if "tags" not in metadata:
+        metadata["tags"] = []
         messages.append("Added missing 'tags' field (empty array)")
 
-    if "doc_uuid" not in updated or not updated.get("doc_uuid"):
-        updated["doc_uuid"] = str(uuid.uuid4())
+    if not metadata.get("doc_uuid"):
+        metadata["doc_uuid"] = str(uuid.uuid4())
         messages.append("Generated missing 'doc_uuid'")
 
-    if "project_id" not in updated or not updated.get("project_id"):
-        updated["project_id"] = "my-project"
+    if not metadata.get("project_id"):
+        metadata["project_id"] = "my-project"
         messages.append("Added default 'project_id'")
 
-    return updated, messages
+    return metadata, messages
 
 
 def fix_whitespace_and_fields(file_path: Path, dry_run: bool = False) -> tuple[bool, list[str]]:
@@ -137,17 +127,23 @@ def fix_whitespace_and_fields(file_path: Path, dry_run: bool = False) -> tuple[b
     """
     messages = []
 
+    # Only the frontmatter header is decoded and rewritten; the body bytes
+    # are passed through untouched. Without a delimited header (e.g. leading
+    # blank lines) fall back to the whole document.
     try:
-        content = file_path.read_text(encoding="utf-8")
-        post = frontmatter.loads(content)
+        raw = file_path.read_bytes()
+        raw_header, body = split_frontmatter(raw)
+        header = (raw_header or raw).decode("utf-8")
+        # Skip the YAML parser entirely for files that cannot have frontmatter
+        if not _FRONTMATTER_START.match(header):
+            return False, ["No frontmatter found"]
+        post = frontmatter.loads(header + "---\n" if raw_header else header)
     except Exception as e:
         return False, [f"Error reading file: {e}"]
 
     if not post.metadata:
         return False, ["No frontmatter found"]
 
-    original = post.metadata.copy()
-
     # Apply fixes
     metadata = post.metadata
 
@@ -163,19 +159,26 @@ def fix_whitespace_and_fields(file_path: Path, dry_run: bool = False) -> tuple[b
     metadata, required_msgs = ensure_required_fields(metadata)
     messages.extend(required_msgs)
 
-    # Check if anything changed
-    changed = metadata != original
+    # Every fix reports what it changed, so no messages means nothing changed
+    if not messages:
+        return False, []
 
-    if changed:
-        post.metadata = metadata
+    post.metadata = metadata
+    try:
+        new_header = frontmatter_dumps(post)
+    except Exception as e:
+        return False, [f"Error writing file: {e}"]
+    if raw_header:
+        new_header = restore_header(new_header, header)
 
-        if not dry_run:
-            try:
-                new_content = frontmatter_dumps(post)
-                file_path.write_text(new_content, encoding="utf-8")
-            except Exception as e:
-                return False, [f"Error writing file: {e}"]
+    # A metadata change that serializes back to the same bytes is not a change
+    if new_header == header:
+        return False, []
 
-        return True, messages
+    if not dry_run:
+        try:
+            file_path.write_bytes(new_header.encode("utf-8") + (body if raw_header else b""))
+        except Exception as e:
+            return False, [f"Error writing file: {e}"]
 
-    return False, []
+    return True, messages
@@ -25,6 +25,9 @@ _DATE_RE = re.compile(
     r")?$"
 )
 
+# Frontmatter delimiter line, matching python-frontmatter's YAML boundary
+_FRONTMATTER_BOUNDARY = re.compile(rb"^-{3,}\s*$", re.MULTILINE)
+
 
 class _ConsistentDumper(yaml.SafeDumper):
     """YAML dumper that preserves formatting conventions."""
@@ -86,6 +89,52 @@ _ConsistentDumper.add_representer(datetime, _represent_datetime)
 _ConsistentDumper.add_representer(date, _represent_date)
 _ConsistentDumper.add_representer(list, _represent_list)
 
+# The same representers on libyaml's C emitter, when PyYAML was built with it
+_FastConsistentDumper: type[yaml.SafeDumper] | None = None
+if yaml.__with_libyaml__:
+
+    class _CConsistentDumper(yaml.CSafeDumper):
+        """C-accelerated dumper with the _ConsistentDumper representers."""
+
+        yaml_representers = dict(_ConsistentDumper.yaml_representers)
+
+    _FastConsistentDumper = _CConsistentDumper  # type: ignore[assignment]
+
+
+def split_frontmatter(raw: bytes) -> tuple[bytes, bytes]:
+    """Split raw file content into the frontmatter header and the remainder.
+
+    The header runs from the opening '---' line through the newline ending
+    the last YAML line; the remainder starts at the closing delimiter line.
+    Delimiters are whole lines, as python-frontmatter requires. Returns
+    (b"", raw) when there is no delimited frontmatter block.
+    """
+    opening_end = raw.find(b"\n") + 1
+    if not opening_end or not _FRONTMATTER_BOUNDARY.match(raw):
+        return b"", raw
+    # bytes.find jumps between candidate lines far faster than a multiline
+    # regex search steps through every position of a long header
+    newline = raw.find(b"\n---", opening_end - 1)
+    while newline >= 0:
+        if _FRONTMATTER_BOUNDARY.match(raw, newline + 1):
+            return raw[: newline + 1], raw[newline + 1 :]
+        newline = raw.find(b"\n---", newline + 1)
+    return b"", raw
+
+
+def restore_header(dumped: str, header: str) -> str:
+    """Shape a serialized header-only post like the header it replaces.
+
+    The body was left out of the parse (see split_frontmatter), so drop the
+    closing delimiter the serializer added; the body still starts with its
+    own. Keep the file's line endings so a CRLF body isn't joined to an LF
+    header.
+    """
+    dumped = dumped.removesuffix("---")
+    if header.endswith("\r\n"):
+        dumped = dumped.replace("\n", "\r\n")
+    return dumped
+
 
 def dumps(post: frontmatter.Post) -> str:
     """Serialize a frontmatter Post with consistent formatting.
@@ -101,4 +150,11 @@ def dumps(post: frontmatter.Post) -> str:
     Returns:
         Serialized markdown string with frontmatter
     """
+    if _FastConsistentDumper is not None:
+        text = frontmatter.dumps(post, Dumper=_FastConsistentDumper, sort_keys=False)
+        # libyaml escapes some characters the Python emitter writes as-is
+        # (e.g. emoji), so any escape in the header falls back to the Python
+        # emitter to keep the output identical. The body is never escaped.
+        if "\\" not in text[: len(text) - len(post.content.rstrip())]:
+            return text
     return frontmatter.dumps(post, Dumper=_ConsistentDumper, sort_keys=False)
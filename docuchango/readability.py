@@ -25,8 +25,14 @@ Usage:
     results = scorer.analyze_document(markdown_content)
 """
 
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import chain, count
+from typing import NamedTuple
 
 try:
     import textstat  # type: ignore[import-untyped]
@@ -38,6 +44,78 @@ except ImportError:
     textstat = None  # type: ignore[assignment, unused-ignore]
 
 
+# First characters of headings, list items and blockquotes, which are not prose
+_SKIP_PREFIXES = frozenset("#-*+>")
+
+# Documents with at least this many paragraphs are scored in worker processes;
+# below it, process dispatch costs more than it saves
+_PARALLEL_MIN_PARAGRAPHS = 8
+
+# Sample text for loading textstat's word lists and syllable dictionary up front
+_WARMUP_TEXT = "The quick brown fox jumps over the lazy dog. It was not amused by the situation."
+
+# Leading frontmatter ends at the next "---" line, or runs to the end of the
+# document when it is never closed
+_FRONTMATTER_BLOCK_RE = re.compile(
+    r"(?:[^\S\n]*\n)*[^\S\n]*---[^\S\n]*$(?:\n(?![^\S\n]*---[^\S\n]*$).*)*(?:\n.*)?",
+    re.MULTILINE,
+)
+
+
+def _find_fence(markdown_content: str, pos: int) -> int:
+    """Return the start of the next line at or after pos that opens or closes a fence, or -1."""
+    while True:
+        idx = markdown_content.find("```", pos)
+        if idx == -1:
+            return -1
+        line_start = markdown_content.rfind("\n", 0, idx) + 1
+        if line_start >= pos and (line_start == idx or markdown_content[line_start:idx].isspace()):
+            return line_start
+        pos = idx + 3
+
+
+def _readable_lines(markdown_content: str) -> Iterator[tuple[int, str]]:
+    """Iterate (line_number, line) pairs outside frontmatter and fenced code.
+
+    Frontmatter and code blocks never contain prose, so they are located with
+    C-level string searches instead of being walked line by line. Each skipped
+    block is reported as a single blank line so it still ends the paragraph
+    before it, and line numbers keep counting through it.
+    """
+    segments: list[Iterable[tuple[int, str]]] = []
+    line_number = 1
+    pos = 0
+
+    def skip_block(start: int, end: int) -> None:
+        nonlocal line_number, pos
+        # Blocks start at a line boundary, so the segment ends with a newline
+        lines = markdown_content[pos:start].split("\n")
+        lines.pop()
+        segments.append(zip(count(line_number), lines))
+        line_number += len(lines)
+        segments.append(((line_number, ""),))
+        line_number += markdown_content.count("\n", start, end) + 1
+        pos = end + 1
+
+    frontmatter = _FRONTMATTER_BLOCK_RE.match(markdown_content)
+    if frontmatter:
+        skip_block(0, frontmatter.end())
+
+    while pos <= len(markdown_content):
+        start = _find_fence(markdown_content, pos)
+        if start == -1:
+            break
+        # An unterminated fence runs to the end of the document
+        open_end = markdown_content.find("\n", start)
+        close = -1 if open_end == -1 else _find_fence(markdown_content, open_end + 1)
+        end = -1 if close == -1 else markdown_content.find("\n", close)
+        skip_block(start, len(markdown_content) if end == -1 else end)
+
+    if pos <= len(markdown_content):
+        segments.append(zip(count(line_number), markdown_content[pos:].split("\n")))
+    return chain.from_iterable(segments)
+
+
 class ReadabilityMetric(Enum):
     """Available readability metrics."""
 
@@ -56,7 +134,8 @@ class ReadabilityConfig:
     """Configuration for readability thresholds.
 
     Thresholds determine when a paragraph fails readability checks.
-    Set thresholds to None to disable that metric.
+    Set thresholds to None to disable that metric; disabled metrics are not
+    computed and stay None on ParagraphScore.
 
     Flesch Reading Ease ranges (higher = easier):
     - 90-100: Very Easy (5th grade)
@@ -83,8 +162,13 @@ class ReadabilityConfig:
     automated_readability_index_max: float | None = 10.0
     coleman_liau_index_max: float | None = 10.0
     dale_chall_max: float | None = 9.0
+    # Report textstat's consensus grade level (text_standard); it has no threshold
+    # and runs every grade-level test internally, so turn it off when unused
+    text_standard: bool = True
     # Minimum paragraph length to analyze (in characters)
     min_paragraph_length: int = 100
+    # Worker processes for scoring documents with many paragraphs (1 = in-process)
+    max_workers: int = 1
 
 
 @dataclass
@@ -130,6 +214,112 @@ class DocumentReadabilityReport:
         return errors
 
 
+class _MetricValues(NamedTuple):
+    """Metric values for a paragraph, named after the ParagraphScore fields."""
+
+    flesch_reading_ease: float | None
+    flesch_kincaid_grade: float | None
+    gunning_fog: float | None
+    smog_index: float | None
+    automated_readability_index: float | None
+    coleman_liau_index: float | None
+    dale_chall: float | None
+    text_standard: str | None
+
+
+@lru_cache(maxsize=4096)
+def _score_text(text: str, enabled: frozenset[ReadabilityMetric]) -> _MetricValues:
+    """Compute the enabled metrics for a paragraph.
+
+    Documentation sites repeat boilerplate paragraphs across many pages, so
+    results are memoized on the text and the set of enabled metrics. The
+    cache is per process: paragraphs scored in worker processes neither use
+    nor fill the parent's cache.
+    """
+    flesch_reading_ease: float | None = None
+    flesch_kincaid_grade: float | None = None
+    gunning_fog: float | None = None
+    smog_index: float | None = None
+    automated_readability_index: float | None = None
+    coleman_liau_index: float | None = None
+    dale_chall: float | None = None
+    text_standard: str | None = None
+
+    # Count words and sentences once and derive the closed-form indices from
+    # them instead of letting each textstat metric re-tokenize the paragraph.
+    # Metrics with no threshold are skipped. The formulas and zero guards match
+    # textstat 0.7.13, the minimum version, which reports 0.0 rather than
+    # raising when a ratio is undefined. TypeError covers an older textstat
+    # whose helpers lack the keyword arguments used here.
+    try:
+        words = textstat.lexicon_count(text)
+        sentences = textstat.sentence_count(text)
+        words_per_sentence = words / sentences if sentences else 0.0
+
+        if ReadabilityMetric.FLESCH_READING_EASE in enabled or ReadabilityMetric.FLESCH_KINCAID_GRADE in enabled:
+            syllables_per_word = textstat.syllable_count(text) / words if words else 0.0
+            defined = bool(words_per_sentence and syllables_per_word)
+            if ReadabilityMetric.FLESCH_READING_EASE in enabled:
+                flesch_reading_ease = (
+                    206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word if defined else 0.0
+                )
+            if ReadabilityMetric.FLESCH_KINCAID_GRADE in enabled:
+                flesch_kincaid_grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59 if defined else 0.0
+
+        if ReadabilityMetric.GUNNING_FOG in enabled:
+            # textstat's FOG counts words of 3+ syllables that are not on the easy-word list
+            complex_words = textstat.difficult_words(text, syllable_threshold=3, unique=False)
+            gunning_fog = 0.4 * (words_per_sentence + 100 * complex_words / words) if words else 0.0
+
+        if ReadabilityMetric.SMOG_INDEX in enabled:
+            polysyllables = textstat.polysyllabcount(text)
+            smog_index = 1.043 * (30 * (polysyllables / sentences)) ** 0.5 + 3.1291 if sentences else 0.0
+
+        if ReadabilityMetric.AUTOMATED_READABILITY_INDEX in enabled:
+            # ARI divides by the word count including punctuation-only tokens
+            raw_words = textstat.lexicon_count(text, removepunct=False)
+            chars_per_word = textstat.char_count(text) / raw_words if raw_words else 0.0
+            if chars_per_word and words_per_sentence:
+                automated_readability_index = 4.71 * chars_per_word + 0.5 * words_per_sentence - 21.43
+            else:
+                automated_readability_index = 0.0
+
+        if ReadabilityMetric.COLEMAN_LIAU_INDEX in enabled:
+            letters_per_100 = textstat.letter_count(text) / words * 100 if words else 0.0
+            sentences_per_100 = sentences / words * 100 if words else 0.0
+            if letters_per_100 and sentences_per_100:
+                coleman_liau_index = 0.058 * letters_per_100 - 0.296 * sentences_per_100 - 15.8
+            else:
+                coleman_liau_index = 0.0
+    except (ZeroDivisionError, ValueError, TypeError):
+        pass  # Metric calculation failed (insufficient text/sentences)
+
+    # Dale-Chall needs the easy-word list and text_standard the consensus of
+    # all tests, so both stay with textstat.
+    if ReadabilityMetric.DALE_CHALL in enabled:
+        try:
+            dale_chall = textstat.dale_chall_readability_score(text)
+        except (ZeroDivisionError, ValueError):
+            pass
+
+    if ReadabilityMetric.TEXT_STANDARD in enabled:
+        try:
+            text_standard = textstat.text_standard(text, float_output=False)
+        except (ZeroDivisionError, ValueError):
+            pass
+
+    return _MetricValues(
+        flesch_reading_ease=flesch_reading_ease,
+        flesch_kincaid_grade=flesch_kincaid_grade,
+        gunning_fog=gunning_fog,
+        smog_index=smog_index,
+        automated_readability_index=automated_readability_index,
+        coleman_liau_index=coleman_liau_index,
+        dale_chall=dale_chall,
+        text_standard=text_standard,
+    )
+
+
 class ReadabilityScorer:
     """Analyzes document readability using multiple metrics."""
 
@@ -140,12 +330,38 @@ class ReadabilityScorer:
             config: Readability configuration with thresholds
         """
         self.config = config
+        self._pool: ProcessPoolExecutor | None = None
+        # Metrics whose threshold is None are never compared, so skip computing them
+        thresholds = {
+            ReadabilityMetric.FLESCH_READING_EASE: config.flesch_reading_ease_min,
+            ReadabilityMetric.FLESCH_KINCAID_GRADE: config.flesch_kincaid_grade_max,
+            ReadabilityMetric.GUNNING_FOG: config.gunning_fog_max,
+            ReadabilityMetric.SMOG_INDEX: config.smog_index_max,
+            ReadabilityMetric.AUTOMATED_READABILITY_INDEX: config.automated_readability_index_max,
+            ReadabilityMetric.COLEMAN_LIAU_INDEX: config.coleman_liau_index_max,
+            ReadabilityMetric.DALE_CHALL: config.dale_chall_max,
+        }
+        self._enabled = frozenset(metric for metric, threshold in thresholds.items() if threshold is not None)
+        if config.text_standard:
+            self._enabled |= {ReadabilityMetric.TEXT_STANDARD}
         if not TEXTSTAT_AVAILABLE:
             raise ImportError(
                 "textstat library is required for readability analysis. "
                 "Install it with: uv sync --extra readability or pip install docuchango[readability]"
             )
 
+    @classmethod
+    def warmup(cls) -> None:
+        """Load textstat's word lists and syllable dictionary in this process.
+
+        textstat loads them lazily on first use, which takes far longer than
+        scoring a paragraph. Warming up before the worker pool starts lets
+        forked workers inherit the loaded data instead of each loading it
+        again. Reuse one scorer across documents so this happens only once.
+        """
+        if TEXTSTAT_AVAILABLE:
+            textstat.text_standard(_WARMUP_TEXT)
+
     def extract_paragraphs(self, markdown_content: str) -> list[tuple[str, int]]:
         """Extract readable paragraphs from markdown content.
 
@@ -159,24 +375,23 @@ class ReadabilityScorer:
         Returns:
             List of (paragraph_text, line_number) tuples
         """
-        lines = markdown_content.split("\n")
         paragraphs = []
         current_paragraph: list[str] = []
         current_paragraph_start_line = 0
-        in_code_block = False
-        in_frontmatter = False
+        # Length of the joined paragraph, so short ones are dropped unjoined
+        current_paragraph_length = -1
         in_html_block = False
         in_html_comment = False
-        frontmatter_count = 0
 
         def flush_current_paragraph() -> None:
-            nonlocal current_paragraph
+            nonlocal current_paragraph, current_paragraph_length
             if not current_paragraph:
                 return
-            para_text = " ".join(current_paragraph).strip()
-            if len(para_text) >= self.config.min_paragraph_length:
-                paragraphs.append((para_text, current_paragraph_start_line))
+            # Lines are stripped and non-empty, so the joined text needs no strip
+            if current_paragraph_length >= self.config.min_paragraph_length:
+                paragraphs.append((" ".join(current_paragraph), current_paragraph_start_line))
             current_paragraph = []
+            current_paragraph_length = -1
 
         def is_void_html_tag_line(stripped_line: str) -> bool:
             lower_line = stripped_line.lower()
@@ -185,28 +400,9 @@ class ReadabilityScorer:
                 for tag in ("br", "hr", "img", "input", "meta", "link")
             )
 
-        for i, line in enumerate(lines, start=1):
+        for i, line in _readable_lines(markdown_content):
             stripped = line.strip()
-
-            # Track frontmatter
-            if stripped == "---":
-                frontmatter_count += 1
-                if frontmatter_count <= 2:
-                    in_frontmatter = frontmatter_count == 1
-                    continue
-
-            if in_frontmatter:
-                continue
-
-            # Track code blocks
-            if stripped.startswith("```"):
-                in_code_block = not in_code_block
-                if in_code_block:
-                    flush_current_paragraph()
-                continue
-
-            if in_code_block:
-                continue
+            first = stripped[:1]
 
             # Track HTML comments (multi-line support)
             if "<!--" in stripped:
@@ -225,7 +421,7 @@ class ReadabilityScorer:
                 continue
 
             # Track HTML/MDX blocks (opening and closing tags)
-            if stripped.startswith("<"):
+            if first == "<":
                 flush_current_paragraph()
 
                 is_single_line_tag = stripped.endswith("/>") or "</" in stripped or is_void_html_tag_line(stripped)
@@ -234,14 +430,7 @@ class ReadabilityScorer:
                 continue
 
             # Skip headings, lists, empty lines, blockquotes
-            if (
-                stripped.startswith("#")
-                or stripped.startswith("-")
-                or stripped.startswith("*")
-                or stripped.startswith("+")
-                or stripped.startswith(">")  # blockquotes
-                or not stripped
-            ):
+            if not first or first in _SKIP_PREFIXES:
                 flush_current_paragraph()
                 continue
 
@@ -251,6 +440,7 @@ class ReadabilityScorer:
 
             # Add line to current paragraph
             current_paragraph.append(stripped)
+            current_paragraph_length += len(stripped) + 1
 
         # Flush final paragraph
         flush_current_paragraph()
@@ -265,52 +455,11 @@ class ReadabilityScorer:
             line_number: Line number where paragraph starts
 
         Returns:
-            ParagraphScore with all metrics and threshold violations
+            ParagraphScore with the enabled metrics and threshold violations
         """
-        score = ParagraphScore(paragraph_text=text, line_number=line_number)
-
-        # Calculate all metrics
-        # textstat may raise ZeroDivisionError, ValueError, or other exceptions for
-        # text that is too short or doesn't have enough sentences/syllables
-        try:
-            score.flesch_reading_ease = textstat.flesch_reading_ease(text)
-        except (ZeroDivisionError, ValueError):
-            pass  # Metric calculation failed (insufficient text/sentences)
-
-        try:
-            score.flesch_kincaid_grade = textstat.flesch_kincaid_grade(text)
-        except (ZeroDivisionError, ValueError):
-            pass
-
-        try:
-            score.gunning_fog = textstat.gunning_fog(text)
-        except (ZeroDivisionError, ValueError):
-            pass
-
-        try:
-            score.smog_index = textstat.smog_index(text)
-        except (ZeroDivisionError, ValueError):
-            pass  # SMOG requires at least 3 sentences
-
-        try:
-            score.automated_readability_index = textstat.automated_readability_index(text)
-        except (ZeroDivisionError, ValueError):
-            pass
-
-        try:
-            score.coleman_liau_index = textstat.coleman_liau_index(text)
-        except (ZeroDivisionError, ValueError):
-            pass
-
-        try:
-            score.dale_chall = textstat.dale_chall_readability_score(text)
-        except (ZeroDivisionError, ValueError):
-            pass
-
-        try:
-            score.text_standard = textstat.text_standard(text, float_output=False)
-        except (ZeroDivisionError, ValueError):
-            pass
+        score = ParagraphScore(
+            paragraph_text=text, line_number=line_number, **_score_text(text, self._enabled)._asdict()
+        )
 
         # Check thresholds
         if self.config.flesch_reading_ease_min is not None and score.flesch_reading_ease is not None:
@@ -376,10 +525,31 @@ class ReadabilityScorer:
         paragraphs = self.extract_paragraphs(markdown_content)
         report.total_paragraphs = len(paragraphs)
 
-        for para_text, line_num in paragraphs:
-            score = self.score_paragraph(para_text, line_num)
+        if len(paragraphs) >= _PARALLEL_MIN_PARAGRAPHS and self.config.max_workers > 1:
+            if self._pool is None:
+                self.warmup()
+                self._pool = ProcessPoolExecutor(max_workers=self.config.max_workers)
+            scores: Iterable[ParagraphScore] = self._pool.map(
+                self.score_paragraph, *zip(*paragraphs, strict=True), chunksize=4
+            )
+        else:
+            scores = (self.score_paragraph(para_text, line_num) for para_text, line_num in paragraphs)
+
+        for score in scores:
             report.paragraph_scores.append(score)
             if score.has_errors():
                 report.paragraphs_with_errors += 1
 
         return report
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __getstate__(self) -> dict[str, object]:
+        # Workers receive the scorer with each batch; the pool stays in the parent
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
@@ -218,6 +218,11 @@ class DocsProjectReadability(BaseModel):
         default=100,
         description="Minimum paragraph length in characters to analyze",
     )
+    max_workers: int = Field(
+        default=1,
+        ge=1,
+        description="Worker processes for scoring documents with many paragraphs (1 = no worker processes)",
+    )
 
     def to_readability_config(self):  # type: ignore[no-untyped-def]
         """Convert to ReadabilityConfig for use with ReadabilityScorer.
@@ -237,6 +242,7 @@ class DocsProjectReadability(BaseModel):
             coleman_liau_index_max=self.coleman_liau_index_max,
             dale_chall_max=self.dale_chall_max,
             min_paragraph_length=self.min_paragraph_length,
+            max_workers=self.max_workers,
         )
 
 
@@ -66,18 +66,18 @@ def test_cli_help():
     """Test that CLI help works."""
     print("\nTesting CLI help...")
 
-    from click.testing import CliRunner
+    import click
 
     from docuchango.cli import main
 
     try:
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
+        # Render the help text directly; no need for CliRunner's I/O capture
+        help_text = main.get_help(click.Context(main))
 
-        if result.exit_code == 0:
+        if "Usage:" in help_text:
             print("✓ CLI help command works")
             return True
-        print(f"✗ CLI help failed with exit code {result.exit_code}")
+        print("✗ CLI help is missing usage text")
         return False
     except Exception as e:
         print(f"✗ CLI test failed: {e}")
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from typing import Any
 
 import pytest
+from click.testing import CliRunner
 
 # Set fixed seed for reproducible test data
 random.seed(42)
@@ -207,6 +208,16 @@ def md_gen():
     return MarkdownGenerator()
 
 
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Fixture providing a Click test runner shared by all CLI tests.
+
+    Each invoke() sets up its own isolated I/O, so the runner carries no
+    state between tests.
+    """
+    return CliRunner()
+
+
 @pytest.fixture
 def sample_frontmatter(data_gen):
     """Fixture providing sample frontmatter data."""
@@ -6,11 +6,23 @@ import frontmatter
 import pytest
 
 from docuchango.fixes.bulk_update import (
+    _should_skip_name,
     bulk_update_files,
     should_skip_file,
     update_frontmatter_bulk,
 )
 
+# Minimal document most cases start from
+BASE_DOC = "---\nid: test\n---\n# Test\n"
+
+
+@pytest.fixture
+def simple_doc(tmp_path):
+    """A BASE_DOC file on disk."""
+    doc = tmp_path / "doc.md"
+    doc.write_text(BASE_DOC)
+    return doc
+
 
 class TestShouldSkipFileEdgeCases:
     """Edge case tests for file skipping logic."""
@@ -38,6 +50,7 @@ class TestShouldSkipFileEdgeCases:
         assert should_skip_file(Path("index.md"))
         assert not should_skip_file(Path("INDEX.md"))  # Case sensitive
         assert not should_skip_file(Path("my-index.md"))
+        assert not should_skip_file(Path("index.md.bak"))
 
     def test_valid_document_names(self):
         """Test that valid documents are not skipped."""
@@ -51,6 +64,16 @@ class TestShouldSkipFileEdgeCases:
         for name in valid_names:
             assert not should_skip_file(Path(name))
 
+    def test_decision_cached_by_file_name(self):
+        """Test the same file name in another directory reuses the cached decision."""
+        _should_skip_name.cache_clear()
+
+        assert not should_skip_file(Path("adr/adr-001.md"))
+        assert not should_skip_file(Path("archive/adr/adr-001.md"))
+        assert should_skip_file(Path("rfcs/template.md"))
+
+        assert _should_skip_name.cache_info().hits == 1
+
 
 class TestUpdateFrontmatterBulkEdgeCases:
     """Edge case tests for bulk frontmatter updates."""
@@ -97,26 +120,75 @@ status: Draft
         post = frontmatter.loads(new_content)
         assert post.metadata["status"] == "Draft"
 
-    def test_remove_nonexistent_field(self):
-        """Test remove operation on missing field."""
+    def test_already_set_skips_parsing(self, monkeypatch):
+        """Test a set/add that is already applied does not parse the frontmatter."""
         content = """---
 id: test
+title: "Quoted: title"
+tags: [a, b]
+status: Accepted
 ---
 # Test
 """
-        new_content, modified, message = update_frontmatter_bulk(content, "status", None, "remove")
+
+        def fail_loads(text):
+            raise AssertionError("frontmatter should not be parsed")
+
+        monkeypatch.setattr(frontmatter, "loads", fail_loads)
+
+        assert update_frontmatter_bulk(content, "status", "Accepted", "set") == (
+            content,
+            False,
+            "Field status already has value 'Accepted'",
+        )
+        assert update_frontmatter_bulk(content, "status", "Draft", "add")[1:] == (False, "Field status already exists")
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "status: Accepted\nstatus: Draft",  # Duplicate key, last one wins
+            "status: Accepted\n  continued",  # Multi-line plain scalar
+            'title: "open\nstatus: Accepted"',  # Key line inside a quoted scalar
+            "status: 'Accepted'\nid: x",  # Quoted value is left to the parser
+            "status: true",  # Loads as a bool, not the string "true"
+        ],
+    )
+    def test_set_falls_back_to_parsing(self, header):
+        """Test headers the line check cannot decide still get a full parse."""
+        content = f"---\n{header}\n---\n# Test\n"
+        expected = frontmatter.loads(content).metadata.get("status")
+
+        new_content, modified, message = update_frontmatter_bulk(content, "status", "Accepted", "set")
+
+        assert modified == (str(expected) != "Accepted")
+        assert frontmatter.loads(new_content).metadata["status"] == "Accepted"
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("status:Accepted", (True, "Added status=Accepted")),  # No space after the colon, so not a key
+            ("id: adr-001\nstatus:Accepted", (False, "Error parsing frontmatter")),
+            ("status: Accepted\n  stray: x", (False, "Error parsing frontmatter")),
+        ],
+    )
+    def test_set_reports_what_the_parser_sees(self, header, expected):
+        """Test a header that is not a clean mapping is not reported as already set."""
+        content = f"---\n{header}\n---\n# Test\n"
+
+        new_content, modified, message = update_frontmatter_bulk(content, "status", "Accepted", "set")
+
+        assert (modified, message[: len(expected[1])]) == expected
+
+    def test_remove_nonexistent_field(self):
+        """Test remove operation on missing field."""
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "status", None, "remove")
 
         assert not modified
         assert "not found" in message
 
     def test_rename_nonexistent_field(self):
         """Test rename operation on missing field."""
-        content = """---
-id: test
----
-# Test
-"""
-        new_content, modified, message = update_frontmatter_bulk(content, "old_name", "new_name", "rename")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "old_name", "new_name", "rename")
 
         assert not modified
         assert "not found" in message
@@ -138,23 +210,17 @@ new_name: value2
         assert "old_name" not in post.metadata
         assert post.metadata["new_name"] == "value1"
 
-    def test_set_with_special_characters(self):
+    @pytest.mark.parametrize(
+        "value",
+        ["value: with: colons", "value with spaces", "value\nwith\nnewlines", "value\twith\ttabs"],
+        ids=["colons", "spaces", "newlines", "tabs"],
+    )
+    def test_set_with_special_characters(self, value):
         """Test setting values with special characters."""
-        content = """---
-id: test
----
-# Test
-"""
-        special_values = [
-            "value: with: colons",
-            "value with spaces",
-            "value\nwith\nnewlines",
-            "value\twith\ttabs",
-        ]
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "field", value, "set")
 
-        for value in special_values:
-            new_content, modified, message = update_frontmatter_bulk(content, "field", value, "set")
-            assert modified
+        assert modified
+        assert frontmatter.loads(new_content).metadata["field"] == value
 
     def test_set_with_empty_string(self):
         """Test setting field to empty string."""
@@ -172,12 +238,7 @@ field: value
 
     def test_set_with_numeric_value(self):
         """Test setting field to numeric value."""
-        content = """---
-id: test
----
-# Test
-"""
-        new_content, modified, message = update_frontmatter_bulk(content, "priority", "123", "set")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "priority", "123", "set")
 
         assert modified
         post = frontmatter.loads(new_content)
@@ -186,14 +247,9 @@ id: test
 
     def test_invalid_operation(self):
         """Test with invalid operation."""
-        content = """---
-id: test
----
-# Test
-"""
         # Should raise ValueError for invalid operations
         with pytest.raises(ValueError, match="Invalid operation"):
-            update_frontmatter_bulk(content, "field", "value", "invalid_op")
+            update_frontmatter_bulk(BASE_DOC, "field", "value", "invalid_op")
 
     def test_rename_requires_new_field_name(self):
         """Test rename operation rejects empty target names."""
@@ -211,13 +267,8 @@ old_name: value
 
     def test_very_long_field_name(self):
         """Test with very long field name."""
-        content = """---
-id: test
----
-# Test
-"""
         long_name = "a" * 1000
-        new_content, modified, message = update_frontmatter_bulk(content, long_name, "value", "set")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, long_name, "value", "set")
 
         assert modified
         post = frontmatter.loads(new_content)
@@ -225,13 +276,8 @@ id: test
 
     def test_very_long_field_value(self):
         """Test with very long field value."""
-        content = """---
-id: test
----
-# Test
-"""
         long_value = "x" * 100000
-        new_content, modified, message = update_frontmatter_bulk(content, "field", long_value, "set")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "field", long_value, "set")
 
         assert modified
         post = frontmatter.loads(new_content)
@@ -239,12 +285,7 @@ id: test
 
     def test_unicode_field_names(self):
         """Test with Unicode field names."""
-        content = """---
-id: test
----
-# Test
-"""
-        new_content, modified, message = update_frontmatter_bulk(content, "фield", "value", "set")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "фield", "value", "set")
 
         assert modified
         post = frontmatter.loads(new_content)
@@ -252,12 +293,7 @@ id: test
 
     def test_unicode_field_values(self):
         """Test with Unicode field values."""
-        content = """---
-id: test
----
-# Test
-"""
-        new_content, modified, message = update_frontmatter_bulk(content, "field", "значение", "set")
+        new_content, modified, message = update_frontmatter_bulk(BASE_DOC, "field", "значение", "set")
 
         assert modified
         post = frontmatter.loads(new_content)
@@ -283,15 +319,12 @@ class TestBulkUpdateFilesEdgeCases:
         assert len(results) == 2
         assert all(not changed for _, changed, _ in results)
 
-    def test_mixed_valid_invalid_files(self, tmp_path):
+    def test_mixed_valid_invalid_files(self, simple_doc):
         """Test with mix of valid and invalid files."""
-        valid = tmp_path / "valid.md"
-        valid.write_text("---\nid: test\n---\n# Test")
-
-        invalid = tmp_path / "invalid.md"
+        invalid = simple_doc.with_name("invalid.md")
         # Don't create invalid file
 
-        results = bulk_update_files([valid, invalid], "field", "value", "set")
+        results = bulk_update_files([simple_doc, invalid], "field", "value", "set")
 
         assert len(results) == 2
         # One should succeed, one should fail
@@ -309,22 +342,21 @@ class TestBulkUpdateFilesEdgeCases:
         file2 = dir2 / "doc2.md"
 
         for f in [file1, file2]:
-            f.write_text("---\nid: test\n---\n# Test")
+            f.write_text(BASE_DOC)
 
         results = bulk_update_files([file1, file2], "field", "value", "set")
 
         assert len(results) == 2
         assert all(changed for _, changed, _ in results)
 
-    def test_duplicate_files_in_list(self, tmp_path):
+    def test_duplicate_files_in_list(self, simple_doc):
         """Test same file listed multiple times.
 
         Note: Each file path in the list is processed independently.
         The first occurrence will add the field, subsequent ones will
         update it (but since it's the same value, no change).
         """
-        doc = tmp_path / "doc.md"
-        doc.write_text("---\nid: test\n---\n# Test")
+        doc = simple_doc
 
         results = bulk_update_files([doc, doc, doc], "field", "value", "set")
 
@@ -340,7 +372,7 @@ class TestBulkUpdateFilesEdgeCases:
         files = []
         for i in range(5):
             doc = tmp_path / f"doc{i}.md"
-            doc.write_text("---\nid: test\n---\n# Test")
+            doc.write_text(BASE_DOC)
             files.append(doc)
 
         # Get original contents
@@ -396,7 +428,7 @@ class TestBulkUpdateFilesEdgeCases:
         files = []
         for i in range(100):
             doc = tmp_path / f"doc{i}.md"
-            doc.write_text("---\nid: test\n---\n# Test")
+            doc.write_text(BASE_DOC)
             files.append(doc)
 
         results = bulk_update_files(files, "field", "value", "set")
@@ -404,10 +436,9 @@ class TestBulkUpdateFilesEdgeCases:
         assert len(results) == 100
         assert all(changed for _, changed, _ in results)
 
-    def test_concurrent_operations_different_fields(self, tmp_path):
+    def test_concurrent_operations_different_fields(self, simple_doc):
         """Test multiple operations on same files."""
-        doc = tmp_path / "doc.md"
-        doc.write_text("---\nid: test\n---\n# Test")
+        doc = simple_doc
 
         # First operation
         bulk_update_files([doc], "field1", "value1", "set")
@@ -419,3 +450,58 @@ class TestBulkUpdateFilesEdgeCases:
         post = frontmatter.loads(doc.read_text())
         assert post.metadata["field1"] == "value1"
         assert post.metadata["field2"] == "value2"
+
+    def test_body_bytes_preserved(self, tmp_path):
+        """Test only the header is rewritten; the body keeps its exact bytes."""
+        doc = tmp_path / "doc.md"
+        body = b"---\n# Test\n\nTrailing spaces   \n\tTabbed\n\n\n"
+        doc.write_bytes(b"---\nid: test\n" + body)
+
+        results = bulk_update_files([doc], "status", "Accepted", "set")
+
+        assert results == [(doc, True, "Added status=Accepted")]
+        assert doc.read_bytes() == b"---\nid: test\nstatus: Accepted\n" + body
+
+    def test_crlf_header_keeps_line_endings(self, tmp_path):
+        """Test a CRLF file gets a CRLF header back."""
+        doc = tmp_path / "doc.md"
+        doc.write_bytes(b"---\r\nid: test\r\nold: value\r\n---\r\n# Test\r\n")
+
+        bulk_update_files([doc], "old", "new", "rename")
+
+        assert doc.read_bytes() == b"---\r\nid: test\r\nnew: value\r\n---\r\n# Test\r\n"
+
+    def test_file_without_frontmatter_gets_header(self, tmp_path):
+        """Test set on a file with no frontmatter still writes the whole document."""
+        doc = tmp_path / "doc.md"
+        doc.write_text("# Test\n\nBody")
+
+        bulk_update_files([doc], "status", "Draft", "set")
+
+        post = frontmatter.loads(doc.read_text())
+        assert post.metadata == {"status": "Draft"}
+        assert post.content == "# Test\n\nBody"
+
+    def test_worker_processes_match_serial_results(self, tmp_path):
+        """Test a process pool returns the serial results, duplicates included."""
+        serial_dir = tmp_path / "serial"
+        pooled_dir = tmp_path / "pooled"
+        for directory in (serial_dir, pooled_dir):
+            directory.mkdir()
+            for i in range(20):
+                (directory / f"doc{i}.md").write_text(f"---\nid: doc{i}\n---\n# Test")
+            (directory / "doc3.md").write_text("---\nid: doc3\nfield: value\n---\n# Test")
+
+        names = [f"doc{i}.md" for i in range(20)] + ["doc5.md", "missing.md", "template.md"]
+        serial = bulk_update_files([serial_dir / name for name in names], "field", "value", "set")
+        pooled = bulk_update_files([pooled_dir / name for name in names], "field", "value", "set", max_workers=2)
+
+        def relative(results, root):
+            return [
+                (path.relative_to(root), changed, message.replace(str(root), "")) for path, changed, message in results
+            ]
+
+        assert relative(pooled, pooled_dir) == relative(serial, serial_dir)
+        assert [changed for path, changed, _ in pooled if path.name == "doc5.md"] == [True, False]
+        for i in range(20):
+            assert (pooled_dir / f"doc{i}.md").read_text() == (serial_dir / f"doc{i}.md").read_text()
@@ -3,30 +3,34 @@
 import subprocess
 from pathlib import Path
 
+import click
 import frontmatter
-from click.testing import CliRunner
 
+from docuchango import __version__
 from docuchango.cli import main, migrate, validate
 
 
+def _help_text(command: click.Command) -> str:
+    """Render a command's --help output without going through CliRunner."""
+    help_text: str = command.get_help(click.Context(command, info_name=command.name))
+    return help_text
+
+
 class TestValidateCommand:
     """Test the validate command."""
 
     def test_validate_help(self):
         """Test that validate command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(validate, ["--help"])
-        assert result.exit_code == 0
-        assert "Validate and fix documentation files" in result.output
-        assert "--repo-root" in result.output
-        assert "--verbose" in result.output
-        assert "--skip-build" in result.output
-        assert "--dry-run" in result.output
-
-    def test_validate_with_verbose(self, docs_repository):
+        output = _help_text(validate)
+        assert "Validate and fix documentation files" in output
+        assert "--repo-root" in output
+        assert "--verbose" in output
+        assert "--skip-build" in output
+        assert "--dry-run" in output
+
+    def test_validate_with_verbose(self, docs_repository, cli_runner):
         """Test validate command with verbose flag."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -39,10 +43,9 @@ class TestValidateCommand:
         assert result.exit_code in [0, 1]
         assert "Validating Documentation" in result.output or "Repository root" in result.output
 
-    def test_validate_skip_build(self, docs_repository):
+    def test_validate_skip_build(self, docs_repository, cli_runner):
         """Test validate command with skip-build flag."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -53,10 +56,9 @@ class TestValidateCommand:
         assert result.exit_code in [0, 1]
         # Should not mention build validation
 
-    def test_validate_nonexistent_path(self):
+    def test_validate_nonexistent_path(self, cli_runner):
         """Test validate command with nonexistent path."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -66,10 +68,9 @@ class TestValidateCommand:
         assert result.exit_code == 2
         # Click will error on invalid path
 
-    def test_validate_with_dry_run(self, docs_repository):
+    def test_validate_with_dry_run(self, docs_repository, cli_runner):
         """Test validate command with --dry-run flag (no fixes applied)."""
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -81,18 +82,16 @@ class TestValidateCommand:
         assert result.exit_code in [0, 1]
         assert "DRY RUN" in result.output
 
-    def test_validate_current_directory(self, tmp_path, monkeypatch):
+    def test_validate_current_directory(self, tmp_path, monkeypatch, cli_runner):
         """Test validate command uses current directory as default."""
-        runner = CliRunner()
-
         # Change to tmp directory
         monkeypatch.chdir(tmp_path)
 
-        result = runner.invoke(validate, ["--skip-build"])
+        result = cli_runner.invoke(validate, ["--skip-build"])
         # Should attempt to validate current directory
         assert result.exit_code in [0, 1, 2]
 
-    def test_validate_actually_applies_fixes(self, tmp_path):
+    def test_validate_actually_applies_fixes(self, tmp_path, cli_runner):
         """Regression test: validate must actually apply fixes, not just report them.
 
         This test ensures the validate command modifies files when fixes are needed.
@@ -121,8 +120,7 @@ Some content here.
         test_file.write_text(original_content, encoding="utf-8")
 
         # Run validate (which now applies fixes by default)
-        runner = CliRunner()
-        runner.invoke(
+        cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -149,7 +147,7 @@ Some content here.
         # - Title whitespace should be trimmed
         assert 'title: "Test ADR  "' not in fixed_content
 
-    def test_validate_dry_run_does_not_modify_files(self, tmp_path):
+    def test_validate_dry_run_does_not_modify_files(self, tmp_path, cli_runner):
         """Test that --dry-run prevents file modifications."""
         # Create directory structure with fixable issues
         adr_dir = tmp_path / "adr"
@@ -167,8 +165,7 @@ tags: "API Design"
         test_file.write_text(original_content, encoding="utf-8")
 
         # Run validate with --dry-run
-        runner = CliRunner()
-        runner.invoke(
+        cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -184,7 +181,7 @@ tags: "API Design"
             "File was modified during --dry-run! Dry run should not modify any files."
         )
 
-    def test_validate_writes_frontmatter_metadata_once(self, tmp_path, monkeypatch):
+    def test_validate_writes_frontmatter_metadata_once(self, tmp_path, monkeypatch, cli_runner):
         """Frontmatter metadata fixes should be batched into one write per file."""
         adr_dir = tmp_path / "adr"
         adr_dir.mkdir()
@@ -217,8 +214,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
 
         monkeypatch.setattr(Path, "write_text", counting_write_text)
 
-        runner = CliRunner()
-        result = runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build"])
+        result = cli_runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build"])
 
         assert result.exit_code == 0
         assert len(writes) == 1
@@ -227,7 +223,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         assert "api-design" in fixed_content
         assert 'title: "Batched Metadata Fixes  "' not in fixed_content
 
-    def test_validate_output_shows_fixes_and_issues_with_paths(self, tmp_path):
+    def test_validate_output_shows_fixes_and_issues_with_paths(self, tmp_path, cli_runner):
         """Test that validate output shows both fixed and unfixable issues with file paths.
 
         This test verifies:
@@ -276,8 +272,7 @@ more code
         unfixable_file.write_text(unfixable_content, encoding="utf-8")
 
         # Run validate
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -310,7 +305,7 @@ more code
         # Original string format should be gone
         assert 'tags: "API Design, Database"' not in fixed_content
 
-    def test_validate_reports_broken_links(self, tmp_path):
+    def test_validate_reports_broken_links(self, tmp_path, cli_runner):
         """Regression test: CLI validate must run link validation."""
         adr_dir = tmp_path / "docs-cms" / "adr"
         adr_dir.mkdir(parents=True)
@@ -335,14 +330,13 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
             encoding="utf-8",
         )
 
-        runner = CliRunner()
-        result = runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build", "--dry-run"])
+        result = cli_runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build", "--dry-run"])
 
         assert result.exit_code == 1
         assert "adr-001-broken-link.md" in result.output
         assert "Broken link './missing.md'" in result.output
 
-    def test_validate_reports_duplicate_ids(self, tmp_path):
+    def test_validate_reports_duplicate_ids(self, tmp_path, cli_runner):
         """Regression test: CLI validate must run document ID validation."""
         adr_dir = tmp_path / "docs-cms" / "adr"
         adr_dir.mkdir(parents=True)
@@ -383,8 +377,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abd
             encoding="utf-8",
         )
 
-        runner = CliRunner()
-        result = runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build", "--dry-run"])
+        result = cli_runner.invoke(validate, ["--repo-root", str(tmp_path), "--skip-build", "--dry-run"])
 
         assert result.exit_code == 1
         assert "adr-002-second.md" in result.output
@@ -396,42 +389,35 @@ class TestMainCommandGroup:
 
     def test_main_help(self):
         """Test main command help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
-        assert "Docuchango" in result.output
-        assert "Commands:" in result.output or "Usage:" in result.output
+        output = _help_text(main)
+        assert "Docuchango" in output
+        assert "Commands:" in output or "Usage:" in output
 
-    def test_main_version(self):
+    def test_main_version(self, cli_runner):
         """Test main command version flag."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--version"])
+        result = cli_runner.invoke(main, ["--version"])
         assert result.exit_code == 0
-        # Should show version number
+        assert __version__ in result.output
 
     def test_all_subcommands_listed(self):
         """Test that all subcommands are listed in main help."""
-        runner = CliRunner()
-        result = runner.invoke(main, ["--help"])
-        assert result.exit_code == 0
         # Check for main command groups
-        output_lower = result.output.lower()
+        output_lower = _help_text(main).lower()
         assert "validate" in output_lower or "init" in output_lower
 
 
 class TestMigrateCommand:
     """Test the migrate command."""
 
-    def test_migrate_help(self):
+    def test_migrate_help(self, cli_runner):
         """Test migrate command shows help."""
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--help"])
+        result = cli_runner.invoke(migrate, ["--help"])
         assert result.exit_code == 0
         assert "Migrate documents" in result.output
         assert "--project-id" in result.output
         assert "--dry-run" in result.output
 
-    def test_migrate_removes_updated_field(self, tmp_path):
+    def test_migrate_removes_updated_field(self, tmp_path, cli_runner):
         """Test that migrate removes the 'updated' field."""
         # Create a git repo
         repo = tmp_path / "repo"
@@ -466,8 +452,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         subprocess.run(["git", "commit", "-m", "Add doc"], cwd=repo, check=True, capture_output=True)
 
         # Run migrate
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
 
         assert result.exit_code == 0
         assert "Removed 'updated' field" in result.output
@@ -477,7 +462,21 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         assert "updated" not in post.metadata
         assert "created" in post.metadata
 
-    def test_migrate_removes_date_field(self, tmp_path):
+    def test_migrate_generates_id_from_doc_type_directory(self, tmp_path, cli_runner):
+        """Test that migrate derives a missing id from the type directory and filename."""
+        rfc_dir = tmp_path / "rfcs"
+        rfc_dir.mkdir()
+        test_file = rfc_dir / "RFC-7-design.md"
+        test_file.write_text('---\ntitle: "Design"\n---\n\n# Design\n', encoding="utf-8")
+
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Generated id: rfc-007" in result.output
+        post = frontmatter.loads(test_file.read_text(encoding="utf-8"))
+        assert post.metadata["id"] == "rfc-007"
+
+    def test_migrate_removes_date_field(self, tmp_path, cli_runner):
         """Test that migrate removes the legacy 'date' field."""
         # Create a git repo
         repo = tmp_path / "repo"
@@ -511,8 +510,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         subprocess.run(["git", "commit", "-m", "Add doc"], cwd=repo, check=True, capture_output=True)
 
         # Run migrate
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
 
         assert result.exit_code == 0
         assert "Removed deprecated 'date' field" in result.output
@@ -526,7 +524,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
 
         assert isinstance(post.metadata["created"], datetime)
 
-    def test_migrate_uses_legacy_date_when_git_history_missing(self, tmp_path):
+    def test_migrate_uses_legacy_date_when_git_history_missing(self, tmp_path, cli_runner):
         """Test that migrate preserves timestamp metadata without git history."""
         adr_dir = tmp_path / "adr"
         adr_dir.mkdir(parents=True)
@@ -548,8 +546,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
 """
         test_file.write_text(content, encoding="utf-8")
 
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--project-id", "test-project", "--path", str(tmp_path)])
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(tmp_path)])
 
         assert result.exit_code == 0
 
@@ -557,7 +554,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         assert "date" not in post.metadata
         assert str(post.metadata["created"]) == "2025-01-01"
 
-    def test_migrate_preserves_existing_created(self, tmp_path):
+    def test_migrate_preserves_existing_created(self, tmp_path, cli_runner):
         """Test that migrate preserves existing 'created' values."""
         # Create a git repo
         repo = tmp_path / "repo"
@@ -592,8 +589,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         subprocess.run(["git", "commit", "-m", "Add doc"], cwd=repo, check=True, capture_output=True)
 
         # Run migrate
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo)])
 
         assert result.exit_code == 0
         assert "Normalized created" not in result.output
@@ -604,7 +600,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         assert "created" in post.metadata
         assert str(post.metadata["created"]) == "2025-01-01"
 
-    def test_migrate_dry_run_no_changes(self, tmp_path):
+    def test_migrate_dry_run_no_changes(self, tmp_path, cli_runner):
         """Test that --dry-run doesn't modify files."""
         # Create a git repo
         repo = tmp_path / "repo"
@@ -639,8 +635,7 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
         subprocess.run(["git", "commit", "-m", "Add doc"], cwd=repo, check=True, capture_output=True)
 
         # Run migrate with --dry-run
-        runner = CliRunner()
-        result = runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo), "--dry-run"])
+        result = cli_runner.invoke(migrate, ["--project-id", "test-project", "--path", str(repo), "--dry-run"])
 
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
@@ -654,42 +649,34 @@ doc_uuid: 12345678-1234-4123-8123-123456789abc
 class TestCLIErrorHandling:
     """Test CLI error handling and edge cases."""
 
-    def test_validate_with_exception(self, docs_repository, monkeypatch):
+    def test_validate_with_exception(self, docs_repository, monkeypatch, cli_runner):
         """Test validate command handles exceptions gracefully."""
-        runner = CliRunner()
-
-        # Create a situation that might cause an exception
-        # by making a read-only directory
-        import os
-
-        test_dir = docs_repository["root"] / "readonly"
-        test_dir.mkdir()
-        os.chmod(test_dir, 0o444)
-
-        try:
-            result = runner.invoke(
-                validate,
-                [
-                    "--repo-root",
-                    str(test_dir),
-                    "--skip-build",
-                ],
-            )
-            # Should handle gracefully
-            assert result.exit_code in [0, 1, 2]
-        finally:
-            # Clean up
-            os.chmod(test_dir, 0o755)
-
-    def test_validate_verbose_with_exception(self, tmp_path):
-        """Test validate command with verbose shows traceback."""
-        runner = CliRunner()
+        from docuchango.validator import DocValidator
+
+        def raise_permission_error(self):
+            raise PermissionError("permission denied")
 
+        monkeypatch.setattr(DocValidator, "scan_documents", raise_permission_error)
+
+        result = cli_runner.invoke(
+            validate,
+            [
+                "--repo-root",
+                str(docs_repository["root"]),
+                "--skip-build",
+            ],
+        )
+
+        assert result.exit_code == 2
+        assert "Error during validation: permission denied" in result.output
+
+    def test_validate_verbose_with_exception(self, tmp_path, cli_runner):
+        """Test validate command with verbose shows traceback."""
         # Create minimal structure that might cause issues
         test_root = tmp_path / "broken"
         test_root.mkdir()
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             validate,
             [
                 "--repo-root",
@@ -705,18 +692,37 @@ class TestCLIErrorHandling:
 class TestBulkUpdateCommand:
     """Test bulk update command validation."""
 
-    def test_bulk_update_rejects_empty_set_field_name(self):
-        runner = CliRunner()
-
-        result = runner.invoke(main, ["bulk", "update", "--set", "=value"])
+    def test_bulk_update_rejects_empty_set_field_name(self, cli_runner):
+        result = cli_runner.invoke(main, ["bulk", "update", "--set", "=value"])
 
         assert result.exit_code == 1
         assert "non-empty field name" in result.output
 
-    def test_bulk_update_rejects_empty_rename_target(self):
-        runner = CliRunner()
-
-        result = runner.invoke(main, ["bulk", "update", "--rename", "old_name="])
+    def test_bulk_update_rejects_empty_rename_target(self, cli_runner):
+        result = cli_runner.invoke(main, ["bulk", "update", "--rename", "old_name="])
 
         assert result.exit_code == 1
         assert "non-empty OLD and NEW" in result.output
+
+    def test_bulk_update_passes_workers(self, tmp_path, monkeypatch, cli_runner):
+        (tmp_path / "adr").mkdir()
+        (tmp_path / "adr" / "adr-001.md").write_text("---\nid: adr-001\n---\n# Test")
+        calls = []
+
+        def fake_bulk_update_files(*args, **kwargs):
+            calls.append(kwargs)
+            return []
+
+        monkeypatch.setattr("docuchango.fixes.bulk_update.bulk_update_files", fake_bulk_update_files)
+
+        result = cli_runner.invoke(
+            main, ["bulk", "update", "--set", "status=Accepted", "--path", str(tmp_path), "--workers", "3"]
+        )
+
+        assert result.exit_code == 0
+        assert calls == [{"max_workers": 3}]
+
+    def test_bulk_update_rejects_zero_workers(self, cli_runner):
+        result = cli_runner.invoke(main, ["bulk", "update", "--set", "status=Accepted", "--workers", "0"])
+
+        assert result.exit_code == 2
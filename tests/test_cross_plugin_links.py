@@ -224,6 +224,17 @@ Just plain text, no links here.
         # but the real link should be fixed
         assert "](/rfc/RFC-002)" in result
 
+    def test_directory_must_match_document_prefix(self, tmp_path):
+        """Test each directory only rewrites links to its own document type."""
+        test_file = tmp_path / "test.md"
+        content = "[a](../adr/RFC-001-x.md) [b](../rfcs/MEMO-002-y.md) [c](../memos/MEMO-003-z.md)"
+        test_file.write_text(content, encoding="utf-8")
+
+        fix_cross_plugin_links(test_file, dry_run=False)
+
+        result = test_file.read_text(encoding="utf-8")
+        assert result == "[a](../adr/RFC-001-x.md) [b](../rfcs/MEMO-002-y.md) [c](/memos/MEMO-003-z)"
+
     def test_case_sensitivity(self, tmp_path):
         """Test that case is preserved."""
         test_file = tmp_path / "test.md"
@@ -15,6 +15,7 @@ from docuchango.fixes.frontmatter import (
     get_doc_type,
 )
 from docuchango.fixes.yaml_utils import dumps as frontmatter_dumps
+from docuchango.fixes.yaml_utils import split_frontmatter
 from docuchango.schemas import ADRFrontmatter, MemoFrontmatter, PRDFrontmatter, RFCFrontmatter
 
 
@@ -454,3 +455,54 @@ date: 2025/01/26
         # Should identify fixes but not apply them
         assert len(messages) >= 2
         assert doc.read_text() == original
+
+
+class TestFrontmatterDumps:
+    """Test the C-accelerated dump matches the pure-Python dumper."""
+
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            {"id": "adr-001", "title": "Test ADR", "tags": ["a", "b"], "date": date(2025, 1, 26)},
+            {"title": "Emoji 😀 title", "tags": ["🚀"]},
+            {"title": "Tab\tand quote's", "created": datetime(2025, 1, 26, 10, 30)},
+        ],
+    )
+    def test_matches_python_dumper(self, metadata, monkeypatch):
+        """Test output is identical with and without the libyaml fast path."""
+        post = frontmatter.Post("# Body with a \\ backslash\n", **metadata)
+        fast = frontmatter_dumps(post)
+
+        monkeypatch.setattr("docuchango.fixes.yaml_utils._FastConsistentDumper", None)
+
+        assert fast == frontmatter_dumps(post)
+
+    def test_emoji_written_unescaped(self):
+        """Test non-BMP characters are not escaped in the header."""
+        post = frontmatter.Post("", title="Launch 🚀")
+
+        assert "title: Launch 🚀" in frontmatter_dumps(post)
+
+
+class TestSplitFrontmatter:
+    """Test locating the closing frontmatter delimiter."""
+
+    @pytest.mark.parametrize(
+        ("raw", "header"),
+        [
+            (b"---\nid: x\n---\nbody\n", b"---\nid: x\n"),
+            (b"---\r\nid: x\r\n---\r\nbody\r\n", b"---\r\nid: x\r\n"),
+            (b"---\n---\nbody", b"---\n"),
+            (b"---\ntitle: x\n--- not a delimiter\n-----  \nbody", b"---\ntitle: x\n--- not a delimiter\n"),
+            (b"---\nfield: " + b"x" * 100_000 + b"\n---\nbody", b"---\nfield: " + b"x" * 100_000 + b"\n"),
+        ],
+        ids=["lf", "crlf", "empty", "delimiter-prefix", "long-value"],
+    )
+    def test_splits_at_closing_delimiter(self, raw, header):
+        """Test the header ends right before the closing delimiter line."""
+        assert split_frontmatter(raw) == (header, raw[len(header) :])
+
+    @pytest.mark.parametrize("raw", [b"# No frontmatter\n", b"---\nid: x\n", b"---", b"\n---\nid: x\n---\n"])
+    def test_no_delimited_header(self, raw):
+        """Test content without an opening and closing delimiter is all body."""
+        assert split_frontmatter(raw) == (b"", raw)
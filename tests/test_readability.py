@@ -8,6 +8,7 @@ from docuchango.readability import (
     ParagraphScore,
     ReadabilityConfig,
     ReadabilityScorer,
+    _score_text,
 )
 
 # Skip all tests if textstat is not available
@@ -27,6 +28,7 @@ class TestReadabilityConfig:
         assert config.flesch_reading_ease_min == 60.0
         assert config.flesch_kincaid_grade_max == 10.0
         assert config.min_paragraph_length == 100
+        assert config.max_workers == 1
 
     def test_custom_config(self):
         """Test custom configuration."""
@@ -178,6 +180,60 @@ This is the actual content paragraph.
         assert "title" not in paragraphs[0][0]
         assert "actual content" in paragraphs[0][0]
 
+    def test_extract_paragraphs_line_numbers_after_skipped_blocks(self):
+        """Test that line numbers count through frontmatter and code blocks."""
+        config = ReadabilityConfig(min_paragraph_length=10)
+        scorer = ReadabilityScorer(config)
+
+        content = """---
+title: Test Document
+---
+First paragraph of readable text.
+```
+code line
+```
+Second paragraph of readable text.
+"""
+        paragraphs = scorer.extract_paragraphs(content)
+        assert paragraphs == [
+            ("First paragraph of readable text.", 4),
+            ("Second paragraph of readable text.", 8),
+        ]
+
+    def test_extract_paragraphs_unterminated_code_block(self):
+        """Test that an unclosed code fence skips the rest of the document."""
+        config = ReadabilityConfig(min_paragraph_length=10)
+        scorer = ReadabilityScorer(config)
+
+        content = """Paragraph before the code block.
+
+```python
+code = "never closed"
+
+Text after the open fence.
+"""
+        paragraphs = scorer.extract_paragraphs(content)
+        assert paragraphs == [("Paragraph before the code block.", 1)]
+
+    def test_extract_paragraphs_horizontal_rule_without_frontmatter(self):
+        """Test that --- rules in the body are not mistaken for frontmatter."""
+        config = ReadabilityConfig(min_paragraph_length=10)
+        scorer = ReadabilityScorer(config)
+
+        content = """First paragraph of readable text.
+
+---
+
+Second paragraph of readable text.
+
+---
+"""
+        paragraphs = scorer.extract_paragraphs(content)
+        assert [text for text, _ in paragraphs] == [
+            "First paragraph of readable text.",
+            "Second paragraph of readable text.",
+        ]
+
     def test_extract_paragraphs_skip_lists(self):
         """Test that lists are skipped."""
         config = ReadabilityConfig(min_paragraph_length=10)
@@ -289,10 +345,83 @@ lines in the source.
         text = "Complex sophisticated implementation of architectural patterns."
         score = scorer.score_paragraph(text, line_number=1)
 
-        # Should have scores but no errors since all thresholds are disabled
-        assert score.flesch_reading_ease is not None
+        # Disabled metrics are not computed; text_standard has no threshold
+        assert score.flesch_reading_ease is None
+        assert score.gunning_fog is None
+        assert score.dale_chall is None
+        assert score.text_standard is not None
         assert not score.has_errors()
 
+    def test_score_paragraph_computes_only_enabled_metrics(self):
+        """Test that only metrics with a threshold are calculated."""
+        config = ReadabilityConfig(
+            flesch_reading_ease_min=None,
+            flesch_kincaid_grade_max=None,
+            gunning_fog_max=None,
+            automated_readability_index_max=None,
+            coleman_liau_index_max=None,
+            dale_chall_max=None,
+        )
+        scorer = ReadabilityScorer(config)
+
+        text = "The cat sat on the mat. The dog played in the yard. Children laughed and ran around."
+        score = scorer.score_paragraph(text, line_number=1)
+
+        assert score.smog_index is not None
+        assert score.flesch_reading_ease is None
+        assert score.flesch_kincaid_grade is None
+        assert score.gunning_fog is None
+        assert score.automated_readability_index is None
+        assert score.coleman_liau_index is None
+        assert score.dale_chall is None
+
+    def test_score_paragraph_skips_text_standard_when_disabled(self, monkeypatch):
+        """Test the consensus grade is not computed when text_standard is off."""
+
+        def text_standard(text, float_output=None):
+            raise AssertionError("text_standard should not be computed")
+
+        monkeypatch.setattr("docuchango.readability.textstat.text_standard", text_standard)
+        _score_text.cache_clear()
+        scorer = ReadabilityScorer(ReadabilityConfig(text_standard=False))
+
+        score = scorer.score_paragraph("The cat sat on the mat. The dog played in the yard.", line_number=1)
+
+        assert score.text_standard is None
+        assert score.flesch_reading_ease is not None
+
+    def test_score_paragraph_tolerates_older_textstat_signatures(self, monkeypatch):
+        """Test a textstat helper without the expected keywords leaves its metric unset."""
+
+        def difficult_words(text, syllable_threshold=2):
+            return 0
+
+        monkeypatch.setattr("docuchango.readability.textstat.difficult_words", difficult_words)
+        _score_text.cache_clear()
+        scorer = ReadabilityScorer(ReadabilityConfig(gunning_fog_max=12.0))
+
+        score = scorer.score_paragraph("The cat sat on the mat. The dog played in the yard.", line_number=1)
+
+        assert score.gunning_fog is None
+        _score_text.cache_clear()
+
+    def test_score_paragraph_reuses_scores_for_repeated_text(self):
+        """Test that repeated paragraphs get equal scores with their own line numbers."""
+        config = ReadabilityConfig(flesch_reading_ease_min=100.0)
+        scorer = ReadabilityScorer(config)
+        text = "This boilerplate paragraph appears at the bottom of every single page."
+
+        _score_text.cache_clear()
+
+        first = scorer.score_paragraph(text, line_number=3)
+        second = scorer.score_paragraph(text, line_number=40)
+
+        assert _score_text.cache_info().hits == 1
+        assert second.line_number == 40
+        assert second.flesch_reading_ease == first.flesch_reading_ease
+        assert second.errors == first.errors
+        assert second.errors is not first.errors
+
     def test_analyze_document_empty(self):
         """Test analyzing an empty document."""
         config = ReadabilityConfig()
@@ -335,6 +464,68 @@ necessitates comprehensive understanding of complex paradigms.
             # Should have some errors due to complex text
             assert report.has_errors()
 
+    def test_analyze_document_parallel_matches_sequential(self):
+        """Test that scoring in worker processes gives the same report."""
+        config = ReadabilityConfig(min_paragraph_length=30)
+        paragraphs = [
+            "The implementation of sophisticated architectural patterns needs care.",
+            "The cat sat on the mat. The dog played in the yard all day.",
+        ] * 6
+        content = "\n\n".join(paragraphs)
+
+        sequential = ReadabilityScorer(config).analyze_document(content)
+        scorer = ReadabilityScorer(ReadabilityConfig(min_paragraph_length=30, max_workers=2))
+        try:
+            parallel = scorer.analyze_document(content)
+        finally:
+            scorer.close()
+
+        assert parallel.total_paragraphs == 12
+        assert parallel.paragraph_scores == sequential.paragraph_scores
+        assert parallel.paragraphs_with_errors == sequential.paragraphs_with_errors
+
+    def test_analyze_document_in_process_by_default(self, monkeypatch):
+        """Test that no worker processes are started unless configured."""
+        monkeypatch.setattr(
+            "docuchango.readability.ProcessPoolExecutor",
+            lambda *_args, **_kwargs: pytest.fail("worker pool was started"),
+        )
+        scorer = ReadabilityScorer(ReadabilityConfig(min_paragraph_length=30))
+
+        report = scorer.analyze_document("\n\n".join(["The cat sat on the mat. The dog played in the yard."] * 12))
+
+        assert report.total_paragraphs == 12
+
+    def test_analyze_document_warms_up_before_starting_pool(self, monkeypatch):
+        """Test textstat is warmed up in the parent before worker processes start."""
+        events = []
+        monkeypatch.setattr(ReadabilityScorer, "warmup", classmethod(lambda _cls: events.append("warmup")))
+
+        class FakePool:
+            def __init__(self, max_workers):
+                events.append(f"pool:{max_workers}")
+
+            def map(self, fn, *iterables, chunksize=1):
+                return map(fn, *iterables)
+
+            def shutdown(self):
+                events.append("shutdown")
+
+        monkeypatch.setattr("docuchango.readability.ProcessPoolExecutor", FakePool)
+        scorer = ReadabilityScorer(ReadabilityConfig(min_paragraph_length=30, max_workers=2))
+        content = "\n\n".join(["The cat sat on the mat. The dog played in the yard."] * 12)
+
+        scorer.analyze_document(content)
+        scorer.analyze_document(content)
+        scorer.close()
+
+        assert events == ["warmup", "pool:2", "shutdown"]
+
+    def test_warmup(self):
+        """Test that warming up textstat can be called repeatedly."""
+        ReadabilityScorer.warmup()
+        ReadabilityScorer.warmup()
+
     def test_analyze_document_disabled(self):
         """Test analyzing with readability disabled."""
         config = ReadabilityConfig(enabled=False)
@@ -630,10 +821,9 @@ The sun is bright. Kids play outside. Everyone is happy. The weather is nice tod
         """
         score = scorer.score_paragraph(text, 1)
 
-        # Scores should be calculated but no errors
+        # No errors, and disabled metrics are skipped entirely
         assert not score.has_errors()
-        # But scores should still be calculated
-        assert score.flesch_reading_ease is not None
+        assert score.flesch_reading_ease is None
 
     def test_very_low_thresholds_allow_all(self):
         """Test that very permissive thresholds allow all text."""
@@ -681,6 +871,14 @@ Comprehensive restructuring incorporating multidimensional approaches facilitati
         # Should have analyzed paragraphs (at least one should be long enough)
         assert report.total_paragraphs >= 1
 
+    def test_min_paragraph_length_counts_joined_text(self):
+        """Test that the length threshold applies to the joined multi-line paragraph."""
+        scorer = ReadabilityScorer(ReadabilityConfig(min_paragraph_length=11))
+
+        paragraphs = scorer.extract_paragraphs("  abcde  \n  fghij  \n\nabcde\nfghi\n")
+
+        assert paragraphs == [("abcde fghij", 1)]
+
     def test_min_paragraph_length_filtering(self):
         """Test that minimum paragraph length is enforced."""
         config = ReadabilityConfig(
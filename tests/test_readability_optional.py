@@ -309,3 +309,4 @@ class TestReadabilityConfigSchema:
         assert config.flesch_kincaid_grade_max == 10.0
         assert config.gunning_fog_max == 12.0
         assert config.min_paragraph_length == 100
+        assert config.max_workers == 1
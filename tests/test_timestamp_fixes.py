@@ -1,18 +1,40 @@
 """Tests for timestamp update functionality."""
 
+import json
+import os
 import subprocess
-from datetime import datetime
+from datetime import date, datetime, timezone
 
 import frontmatter
 
 from docuchango.fixes.timestamps import (
+    TimestampCache,
+    _normalize_git_datetime,
+    frontmatter_value_to_string,
+    get_created_date,
     get_git_dates,
     migrate_date_to_created,
     update_document_timestamps,
     update_frontmatter_field,
+    update_many,
 )
 
 
+def _init_repo(repo):
+    """Create an empty git repository with a test identity."""
+    repo.mkdir()
+    subprocess.run(["git", "init"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo, check=True, capture_output=True)
+
+
+def _commit_all(repo, message, when):
+    """Commit all changes with a fixed author date."""
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+    env = {**os.environ, "GIT_AUTHOR_DATE": when, "GIT_COMMITTER_DATE": when}
+    subprocess.run(["git", "commit", "-m", message], cwd=repo, check=True, capture_output=True, env=env)
+
+
 class TestGetGitDates:
     """Test git date extraction."""
 
@@ -57,6 +79,95 @@ class TestGetGitDates:
         assert created is None
         assert updated is None
 
+    def test_get_git_dates_follows_renames(self, tmp_path):
+        """Test the updated date is the latest edit after a rename, not the rename."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        (repo / "old.md").write_text("# Test")
+        _commit_all(repo, "add", "2020-01-01T00:00:00Z")
+        subprocess.run(["git", "mv", "old.md", "new.md"], cwd=repo, check=True, capture_output=True)
+        _commit_all(repo, "rename", "2021-01-01T00:00:00Z")
+        (repo / "new.md").write_text("# Test\n\nEdited")
+        _commit_all(repo, "edit", "2022-01-01T00:00:00Z")
+
+        created, updated = get_git_dates(repo / "new.md")
+
+        assert created == "2020-01-01T00:00:00Z"
+        assert updated == "2022-01-01T00:00:00Z"
+
+    def test_get_created_date_matches_git_dates(self, tmp_path):
+        """Test the created-only query agrees with get_git_dates."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        test_file = repo / "test.md"
+        test_file.write_text("# Test")
+        _commit_all(repo, "Initial commit", "2020-01-01T00:00:00Z")
+
+        created, _ = get_git_dates(test_file)
+
+        assert get_created_date(test_file) == created
+
+    def test_get_created_date_follows_renames(self, tmp_path):
+        """Test the created date of a renamed file is its original addition."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        (repo / "old.md").write_text("# Test")
+        _commit_all(repo, "add", "2020-01-01T00:00:00Z")
+        subprocess.run(["git", "mv", "old.md", "new.md"], cwd=repo, check=True, capture_output=True)
+        _commit_all(repo, "rename", "2021-01-01T00:00:00Z")
+
+        created, _ = get_git_dates(repo / "new.md")
+
+        assert get_created_date(repo / "new.md") == created == "2020-01-01T00:00:00Z"
+
+    def test_get_created_date_uses_first_addition_of_readded_file(self, tmp_path):
+        """Test a deleted and re-added file keeps its first addition date."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        (repo / "test.md").write_text("# Test")
+        _commit_all(repo, "add", "2019-05-05T00:00:00Z")
+        (repo / "test.md").unlink()
+        _commit_all(repo, "delete", "2020-05-05T00:00:00Z")
+        (repo / "test.md").write_text("# Test again")
+        _commit_all(repo, "re-add", "2023-03-03T00:00:00Z")
+
+        created, _ = get_git_dates(repo / "test.md")
+
+        assert get_created_date(repo / "test.md") == created == "2019-05-05T00:00:00Z"
+
+    def test_get_created_date_for_untracked_file(self, tmp_path):
+        """Test created date is None for a file not in git."""
+        test_file = tmp_path / "test.md"
+        test_file.write_text("# Test")
+
+        assert get_created_date(test_file) is None
+
+
+class TestNormalizeGitDatetime:
+    """Test conversion of git author dates to UTC."""
+
+    def test_utc_offset(self):
+        """Test UTC timestamps are reformatted without conversion."""
+        assert _normalize_git_datetime("2024-01-15T13:45:22+00:00") == "2024-01-15T13:45:22Z"
+        assert _normalize_git_datetime("2024-01-15T13:45:22Z") == "2024-01-15T13:45:22Z"
+
+    def test_non_utc_offset(self):
+        """Test other offsets are converted to UTC, including across a date boundary."""
+        assert _normalize_git_datetime("2024-01-15T13:45:22+02:00") == "2024-01-15T11:45:22Z"
+        assert _normalize_git_datetime("2024-01-15T20:00:00-05:00") == "2024-01-16T01:00:00Z"
+
+
+class TestFrontmatterValueToString:
+    """Test stringification of parsed frontmatter timestamps."""
+
+    def test_values(self):
+        """Test strings, dates, and aware/naive datetimes."""
+        assert frontmatter_value_to_string("2020-01-01") == "2020-01-01"
+        assert frontmatter_value_to_string(date(2020, 1, 1)) == "2020-01-01"
+        assert frontmatter_value_to_string(datetime(2020, 1, 1, 12, 30)) == "2020-01-01T12:30:00"
+        assert frontmatter_value_to_string(datetime(2020, 1, 1, 12, 30, tzinfo=timezone.utc)) == "2020-01-01T12:30:00Z"
+        assert frontmatter_value_to_string(20200101) == "20200101"
+
 
 class TestUpdateFrontmatterField:
     """Test frontmatter field updates."""
@@ -104,6 +215,14 @@ id: "test-001"
         # Should return unchanged content
         assert updated == content
 
+    def test_update_field_with_backslash_value(self):
+        """Test replacement values are inserted literally."""
+        content = "---\nid: test\ncreated: 2025-01-01\n---\n"
+
+        updated = update_frontmatter_field(content, "created", r"C:\1\path")
+
+        assert r"created: C:\1\path" in updated
+
 
 class TestMigrateDateField:
     """Test migrating legacy 'date' field."""
@@ -317,6 +436,18 @@ created: 2020-01-01
         assert not changed
         assert messages == []
 
+    def test_existing_created_skips_git_lookup(self, tmp_path, monkeypatch):
+        """Test documents with created and no legacy date never query git."""
+        doc = tmp_path / "test.md"
+        doc.write_text("---\nid: test\ncreated: 2020-01-01\n---\n# Test")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not be queried")
+
+        monkeypatch.setattr("docuchango.fixes.timestamps.get_created_date", fail)
+
+        assert update_document_timestamps(doc) == (False, [])
+
     def test_migrate_legacy_date_without_git_history(self, tmp_path):
         """Test legacy date can be migrated without git history."""
         doc = tmp_path / "test.md"
@@ -331,6 +462,28 @@ created: 2020-01-01
         assert "date" not in post.metadata
         assert str(post.metadata["created"]) == "2020-01-01"
 
+    def test_body_lines_are_not_edited(self, tmp_path):
+        """Test field lines in the markdown body are left untouched."""
+        doc = tmp_path / "test.md"
+        body = "# Test\n\nstatus: not frontmatter\ndate: also not frontmatter\n"
+        doc.write_text(f"---\nid: test\ndate: 2020-01-01\n---\n{body}")
+
+        changed, _ = update_document_timestamps(doc)
+
+        assert changed
+        assert doc.read_text() == f"---\nid: test\ncreated: 2020-01-01\n---\n{body}"
+
+    def test_body_bytes_are_preserved(self, tmp_path):
+        """Test the body is written back byte-for-byte without being decoded."""
+        doc = tmp_path / "test.md"
+        body = "# Tést\n".encode() + b"\xff legacy bytes\n"
+        doc.write_bytes(b"---\nid: test\ndate: 2020-01-01\n---\n" + body)
+
+        changed, _ = update_document_timestamps(doc)
+
+        assert changed
+        assert doc.read_bytes() == b"---\nid: test\ncreated: 2020-01-01\n---\n" + body
+
     def test_dry_run_no_changes(self, tmp_path):
         """Test that dry run doesn't write changes."""
         # Create a git repo
@@ -371,3 +524,154 @@ date: 2025-01-26
         assert len(messages) > 0
         # Content should be unchanged
         assert doc.read_text() == original_content
+
+
+class TestUpdateMany:
+    """Test concurrent timestamp updates."""
+
+    def test_results_in_input_order(self, tmp_path):
+        """Test results are yielded in input order for every file."""
+        docs = []
+        for i in range(5):
+            doc = tmp_path / f"doc-{i}.md"
+            doc.write_text(f"---\nid: doc-{i}\ndate: 2020-01-0{i + 1}\n---\n# Test")
+            docs.append(doc)
+
+        results = list(update_many(docs, max_workers=3))
+
+        assert [path for path, _ in results] == docs
+        for i, (path, result) in enumerate(results):
+            assert not isinstance(result, Exception)
+            changed, messages = result
+            assert changed
+            assert messages == ["Migrated 'date' → 'created'"]
+            post = frontmatter.loads(path.read_text())
+            assert str(post.metadata["created"]) == f"2020-01-0{i + 1}"
+
+    def test_exceptions_are_returned_per_file(self, tmp_path, monkeypatch):
+        """Test a failure in one file does not abort the batch."""
+        good = tmp_path / "good.md"
+        good.write_text("---\nid: good\ncreated: 2020-01-01\n---\n# Test")
+        bad = tmp_path / "bad.md"
+        bad.write_text("---\nid: bad\n---\n# Test")
+
+        def fake_update(file_path, dry_run=False, cache=None):
+            if file_path == bad:
+                raise RuntimeError("boom")
+            return False, []
+
+        monkeypatch.setattr("docuchango.fixes.timestamps.update_document_timestamps", fake_update)
+
+        results = dict(update_many([good, bad]))
+
+        assert results[good] == (False, [])
+        assert isinstance(results[bad], RuntimeError)
+
+
+class TestTimestampCache:
+    """Test the cross-run timestamp cache."""
+
+    def test_unchanged_file_is_skipped(self, tmp_path, monkeypatch):
+        """Test a recorded file is skipped until it is modified."""
+        doc = tmp_path / "test.md"
+        doc.write_text("---\nid: test\n---\n# Test")
+
+        cache = TimestampCache.load(tmp_path)
+        assert update_document_timestamps(doc, cache=cache) == (False, ["No git history found"])
+        cache.save()
+
+        calls = []
+
+        def fake_update(file_path, dry_run):
+            calls.append(file_path)
+            return False, []
+
+        monkeypatch.setattr("docuchango.fixes.timestamps._update_document_timestamps", fake_update)
+
+        reloaded = TimestampCache.load(tmp_path)
+        assert update_document_timestamps(doc, cache=reloaded) == (False, [])
+        assert calls == []
+
+        doc.write_text("---\nid: test\nstatus: Draft\n---\n# Test")
+        os.utime(doc, ns=(0, 0))
+        update_document_timestamps(doc, cache=reloaded)
+        assert calls == [doc]
+
+    def test_new_commit_invalidates_entries(self, tmp_path):
+        """Test entries are stamped with HEAD so a new commit forces a re-check."""
+        repo = tmp_path / "repo"
+        _init_repo(repo)
+        doc = repo / "test.md"
+        doc.write_text("---\nid: test\n---\n# Test")
+        _commit_all(repo, "add", "2020-01-01T00:00:00Z")
+
+        cache = TimestampCache.load(repo)
+        cache.record(doc)
+        cache.save()
+        assert TimestampCache.load(repo).is_fresh(doc)
+
+        (repo / "other.md").write_text("# Other")
+        _commit_all(repo, "other", "2021-01-01T00:00:00Z")
+
+        assert not TimestampCache.load(repo).is_fresh(doc)
+
+    def test_dry_run_changes_are_not_recorded(self, tmp_path):
+        """Test pending dry-run changes are re-checked on the next run."""
+        doc = tmp_path / "test.md"
+        doc.write_text("---\nid: test\ndate: 2020-01-01\n---\n# Test")
+
+        cache = TimestampCache.load(tmp_path)
+        changed, _ = update_document_timestamps(doc, dry_run=True, cache=cache)
+
+        assert changed
+        assert not cache.is_fresh(doc)
+
+    def test_failed_updates_are_not_recorded(self, tmp_path, monkeypatch):
+        """Test documents that failed to update are re-checked on the next run."""
+        doc = tmp_path / "test.md"
+        doc.write_text("---\nid: test\n---\n# Test")
+
+        def failing_update(file_path, dry_run):
+            return False, ["Error reading file: boom"]
+
+        monkeypatch.setattr("docuchango.fixes.timestamps._update_document_timestamps", failing_update)
+
+        cache = TimestampCache.load(tmp_path)
+        update_document_timestamps(doc, cache=cache)
+
+        assert not cache.is_fresh(doc)
+
+    def test_version_change_discards_cache(self, tmp_path, monkeypatch):
+        """Test entries from another docuchango version are ignored."""
+        doc = tmp_path / "test.md"
+        doc.write_text("---\nid: test\n---\n# Test")
+
+        cache = TimestampCache.load(tmp_path)
+        cache.record(doc)
+        cache.save()
+
+        monkeypatch.setattr("docuchango.fixes.timestamps.__version__", "0.0.0-other")
+
+        assert not TimestampCache.load(tmp_path).is_fresh(doc)
+
+    def test_unreadable_cache_starts_empty(self, tmp_path):
+        """Test a corrupt cache file is ignored rather than raising."""
+        path = TimestampCache.cache_path(tmp_path)
+        path.parent.mkdir()
+        path.write_text("{not json")
+
+        assert TimestampCache.load(tmp_path).entries == {}
+
+    def test_save_writes_entries_and_gitignore(self, tmp_path):
+        """Test the cache file is written and its directory ignores itself."""
+        doc = tmp_path / "test.md"
+        doc.write_text("# Test")
+
+        cache = TimestampCache.load(tmp_path)
+        cache.record(doc)
+        cache.save()
+
+        data = json.loads(TimestampCache.cache_path(tmp_path).read_text())
+        assert list(data["files"]) == ["test.md"]
+        gitignore = tmp_path / ".docuchango" / ".gitignore"
+        assert gitignore.read_text().splitlines()[-1] == "*"
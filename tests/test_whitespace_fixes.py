@@ -1,6 +1,9 @@
 """Tests for whitespace and required fields fixes."""
 
+from pathlib import Path
+
 import frontmatter
+import pytest
 
 from docuchango.fixes.whitespace import (
     ensure_required_fields,
@@ -41,6 +44,16 @@ class TestTrimStringValues:
         assert updated["deciders"] == ["John Doe", "Jane Smith"]
         assert len(messages) == 2
 
+    def test_trim_mixed_arrays(self):
+        """Test that non-string array items are kept while strings are trimmed."""
+        metadata = {"related": [1, " adr-001 ", None], "clean": [1, "adr-002"]}
+
+        updated, messages = trim_string_values(metadata)
+
+        assert updated["related"] == [1, "adr-001", None]
+        assert updated["clean"] == [1, "adr-002"]
+        assert messages == ["Trimmed whitespace from items in 'related' array"]
+
     def test_preserve_non_strings(self):
         """Test preserving non-string values."""
         metadata = {
@@ -67,6 +80,18 @@ class TestTrimStringValues:
         assert updated == metadata
         assert len(messages) == 0
 
+    def test_updates_metadata_in_place(self):
+        """Test that the metadata dict is updated in place."""
+        tags = ["ok"]
+        metadata = {"title": " Padded ", "tags": tags}
+
+        updated, messages = trim_string_values(metadata)
+
+        assert updated is metadata
+        assert metadata["title"] == "Padded"
+        assert metadata["tags"] is tags
+        assert messages == ["Trimmed whitespace from 'title' field"]
+
 
 class TestNormalizeEmptyValues:
     """Test normalizing empty values."""
@@ -140,6 +165,16 @@ class TestEnsureRequiredFields:
         assert updated["tags"] == []
         assert any("tags" in msg.lower() for msg in messages)
 
+    def test_updates_metadata_in_place(self):
+        """Test that missing fields are added to the given dict."""
+        metadata = {"id": "test", "tags": ["a"], "doc_uuid": "u"}
+
+        updated, messages = ensure_required_fields(metadata)
+
+        assert updated is metadata
+        assert metadata == {"id": "test", "tags": ["a"], "doc_uuid": "u", "project_id": "my-project"}
+        assert messages == ["Added default 'project_id'"]
+
     def test_add_missing_doc_uuid(self):
         """Test adding missing doc_uuid."""
         metadata = {"id": "test"}
@@ -276,3 +311,74 @@ title: "  Needs Trim  "
         assert len(messages) > 0
         # File should be unchanged
         assert doc.read_text() == content
+
+    def test_no_frontmatter_skips_parsing(self, tmp_path):
+        """Test that files without frontmatter are reported without changes."""
+        doc = tmp_path / "test.md"
+        content = "# Title\n\nBody text with --- inside.\n"
+        doc.write_text(content)
+
+        changed, messages = fix_whitespace_and_fields(doc)
+
+        assert not changed
+        assert messages == ["No frontmatter found"]
+        assert doc.read_text() == content
+
+    def test_leading_blank_lines_before_frontmatter(self, tmp_path):
+        """Test that frontmatter after leading blank lines is still fixed."""
+        doc = tmp_path / "test.md"
+        doc.write_text('\n\n---\nid: " test-001 "\n---\n\n# Test\n')
+
+        changed, _ = fix_whitespace_and_fields(doc)
+
+        assert changed
+        assert frontmatter.loads(doc.read_text()).metadata["id"] == "test-001"
+
+    def test_identical_serialization_not_written(self, tmp_path, monkeypatch):
+        """Test that a change serializing to the original bytes is not reported or written."""
+        doc = tmp_path / "test.md"
+        content = '---\nid: " test-001 "\n---\n\n# Test\n'
+        doc.write_text(content)
+        monkeypatch.setattr("docuchango.fixes.whitespace.frontmatter_dumps", lambda _post: '---\nid: " test-001 "\n---')
+        monkeypatch.setattr(Path, "write_bytes", lambda *_args, **_kwargs: pytest.fail("file was rewritten"))
+
+        changed, messages = fix_whitespace_and_fields(doc)
+
+        assert not changed
+        assert messages == []
+
+    def test_body_bytes_preserved(self, tmp_path):
+        """Test that only the header is rewritten and the body is kept byte for byte."""
+        doc = tmp_path / "test.md"
+        body = "---\n\n\n# Test  \n\nBody with trailing spaces   \n\n\n"
+        doc.write_text('---\nid: " test-001 "\ntags: []\ndoc_uuid: "u"\nproject_id: "p"\n' + body)
+
+        changed, _ = fix_whitespace_and_fields(doc)
+
+        assert changed
+        content = doc.read_text()
+        assert content.startswith("---\nid: test-001\n")
+        assert content.endswith(body)
+
+    def test_crlf_line_endings_preserved(self, tmp_path):
+        """Test that a CRLF document keeps CRLF line endings throughout."""
+        doc = tmp_path / "test.md"
+        doc.write_bytes(b'---\r\nid: " test-001 "\r\ntags: []\r\ndoc_uuid: "u"\r\nproject_id: "p"\r\n---\r\n# Test\r\n')
+
+        changed, _ = fix_whitespace_and_fields(doc)
+
+        assert changed
+        content = doc.read_bytes()
+        assert content.startswith(b"---\r\nid: test-001\r\n")
+        assert content.endswith(b"---\r\n# Test\r\n")
+        assert b"\n" not in content.replace(b"\r\n", b"")
+
+    def test_delimiter_prefix_line_not_treated_as_closing(self, tmp_path):
+        """Test that a YAML line starting with dashes does not end the header."""
+        doc = tmp_path / "test.md"
+        doc.write_text('---\nid: " test-001 "\ntags: []\ndoc_uuid: "u"\nproject_id: "p"\n---\n# Test\n---foo\n')
+
+        changed, _ = fix_whitespace_and_fields(doc)
+
+        assert changed
+        assert doc.read_text().endswith("---\n# Test\n---foo\n")